@@ -1,19 +1,68 @@
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, File, Form, HTTPException, Request, Response, UploadFile, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Any, Set
+from fastapi.responses import ORJSONResponse
+from pydantic import Base64Bytes, BaseModel
+from typing import List, Optional, Dict, DefaultDict, Any, Set, NamedTuple, Literal, Tuple
 import os
 import asyncio
-import json
+import gzip
+import hashlib
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import lru_cache
 
+import numpy as np
+import orjson
+from cachetools import TTLCache
+
+from backend.log import get_logger
 from backend.vocab import vocab
 from backend.gemini_client import GeminiClient
 from backend.planner import build_render_plan
 from backend.sign_seq import SignSequenceManager
 from backend.gcs_storage import USE_GCS, get_dataset_info
+from backend.semantic_cache import SemanticCache, USE_SEMANTIC_CACHE, SEMANTIC_CACHE_PATH
+from backend.batch_queue import BatchQueue
+from backend.paths import DATASET_PATH, PROCESSED_PATH
+from backend.static_files import CachedStaticFiles
+
+logger = get_logger(__name__)
+
+THREAD_POOL_SIZE = int(os.environ.get("THREAD_POOL_SIZE", "64"))
+
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Blocking Gemini/GCS calls run via asyncio.to_thread; size the default
+    # executor so concurrent requests aren't capped at min(32, cpu + 4)
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=THREAD_POOL_SIZE, thread_name_prefix="unmute-worker")
+    )
+    # Persisted state must be loaded before serving; read it off the event loop
+    if semantic_cache is not None and SEMANTIC_CACHE_PATH:
+        await asyncio.to_thread(semantic_cache.load, SEMANTIC_CACHE_PATH)
+    batch_queue.start()
+    
+    # Warm-ups run concurrently in the background so startup (and health
+    # checks) aren't delayed; holding the gather future keeps the tasks alive
+    warmups = [gemini.warmup()]
+    if PRELOAD_LANDMARKS:
+        warmups.append(asyncio.to_thread(_preload_landmarks))
+    warmup = asyncio.gather(*warmups, return_exceptions=True)
+    
+    yield
+    
+    _preload_stop.set()
+    warmup.cancel()
+    await batch_queue.stop()
+    await gemini.aclose()
+    if semantic_cache is not None and SEMANTIC_CACHE_PATH:
+        await asyncio.to_thread(semantic_cache.save, SEMANTIC_CACHE_PATH)
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # CORS
 app.add_middleware(
@@ -22,27 +71,99 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # The frontend is cross-origin; encoding=bin keeps its layout in headers
+    expose_headers=["X-Landmark-Shape", "X-Landmark-Scale", "X-Landmark-L-Orig", "X-Landmark-L-Max", "ETag"],
 )
 
 # Mount Static Directories for sign language assets only (when not using GCS)
 # When USE_GCS=true, assets are served directly from Google Cloud Storage
-DATASET_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "sgsl_dataset")
-PROCESSED_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "sgsl_processed")
-
 if not USE_GCS:
-    print("[App] Using local static file serving")
-    if os.path.exists(DATASET_PATH):
-        app.mount("/static/sgsl_dataset", StaticFiles(directory=DATASET_PATH), name="sgsl_dataset")
-    if os.path.exists(PROCESSED_PATH):
-        app.mount("/static/sgsl_processed", StaticFiles(directory=PROCESSED_PATH), name="sgsl_processed")
+    logger.info("[App] Using local static file serving")
+    if DATASET_PATH.is_dir():
+        app.mount("/static/sgsl_dataset", CachedStaticFiles(directory=DATASET_PATH, check_dir=False), name="sgsl_dataset")
+    if PROCESSED_PATH.is_dir():
+        app.mount("/static/sgsl_processed", CachedStaticFiles(directory=PROCESSED_PATH, check_dir=False), name="sgsl_processed")
 else:
-    print(f"[App] Using GCS for static files: {get_dataset_info()['public_url']}")
+    logger.info("[App] Using GCS for static files: %s", get_dataset_info()['public_url'])
 
 
 
 # Components
 gemini = GeminiClient()
 sign_mgr = SignSequenceManager()
+# Coalesces concurrent text_to_gloss calls into batched Gemini requests
+batch_queue = BatchQueue(gemini)
+
+# text_to_gloss results keyed by (normalized text, language). Gemini is by far
+# the slowest step of a translation, and demo phrases / replayed transcriptions
+# repeat verbatim, so hits skip the round-trip entirely.
+GLOSS_CACHE_SIZE = int(os.environ.get("GLOSS_CACHE_SIZE", "4096"))
+GLOSS_CACHE_TTL = int(os.environ.get("GLOSS_CACHE_TTL", "3600"))
+_gloss_cache: TTLCache = TTLCache(maxsize=GLOSS_CACHE_SIZE, ttl=GLOSS_CACHE_TTL)
+
+# Optional second layer matching paraphrases by embedding similarity
+semantic_cache = SemanticCache() if USE_SEMANTIC_CACHE else None
+
+
+def _normalize_text(text: str) -> str:
+    """Collapse case and whitespace so trivial variants share a cache entry."""
+    return " ".join(text.lower().split())
+
+
+# Misses currently being fetched, so concurrent identical requests share one call
+_inflight_gloss: Dict[tuple, asyncio.Task] = {}
+
+# Where translate lookups were answered from, reported by /api/cache/stats
+_gloss_stats = {"hits": 0, "inflight_joins": 0, "semantic_hits": 0, "misses": 0}
+
+
+async def _cached_text_to_gloss(text: str, language: Optional[str]) -> Dict[str, Any]:
+    """
+    gemini.text_to_gloss with a TTL cache in front. Errors are not cached.
+    Misses go through the batch queue on the async Gemini client.
+    Concurrent misses for the same key await a single in-flight fetch.
+    """
+    key = (_normalize_text(text), language)
+    cached = _gloss_cache.get(key)
+    if cached is not None:
+        _gloss_stats["hits"] += 1
+        return cached
+
+    task = _inflight_gloss.get(key)
+    if task is None:
+        task = asyncio.create_task(_fetch_gloss(text, language, key))
+        _inflight_gloss[key] = task
+        task.add_done_callback(lambda _: _inflight_gloss.pop(key, None))
+    else:
+        _gloss_stats["inflight_joins"] += 1
+    # Shielded so one caller disconnecting doesn't cancel the fetch for the others
+    return await asyncio.shield(task)
+
+
+async def _fetch_gloss(text: str, language: Optional[str], key: tuple) -> Dict[str, Any]:
+    embedding = None
+    if semantic_cache is not None:
+        embedding = await gemini.embed_text_async(text)
+        if embedding is not None:
+            similar = semantic_cache.lookup(embedding, language)
+            if similar is not None:
+                _gloss_stats["semantic_hits"] += 1
+                _gloss_cache[key] = similar
+                return similar
+
+    _gloss_stats["misses"] += 1
+    gloss_result = await batch_queue.submit(text, language)
+    if "error" not in gloss_result:
+        _gloss_cache[key] = gloss_result
+        if embedding is not None:
+            semantic_cache.add(embedding, language, gloss_result)
+    return gloss_result
+
+@lru_cache(maxsize=8192)
+def _plan_cached(gloss_tokens: tuple) -> List[Dict[str, Any]]:
+    """build_render_plan memoized on the token sequence. Callers must not mutate the result."""
+    return build_render_plan(list(gloss_tokens))
+
 
 class GlossRequest(BaseModel):
     text: str
@@ -57,58 +178,231 @@ class RenderPlanItem(BaseModel):
 class TranslateResponse(BaseModel):
     gloss: List[str]
     unmatched: List[str]
-    plan: List[Dict[str, Any]]
+    plan: List[RenderPlanItem]
     notes: Optional[str] = None
     detected_language: Optional[str] = None  # Language code if auto-detected
 
+# Health checks are polled frequently and nothing in the body changes after
+# startup, so it is encoded once
+_VOCAB_SIZE = len(vocab.get_allowed_tokens())
+_STORAGE_INFO = get_dataset_info()
+_HEALTH_BODY = orjson.dumps({
+    "status": "ok",
+    "vocab_size": _VOCAB_SIZE,
+    "storage": _STORAGE_INFO,
+})
+
 @app.get("/health")
-def health():
-    storage_info = get_dataset_info()
+async def health():
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+@app.get("/api/cache/stats")
+async def cache_stats():
+    """Sizes and hit counts of the in-process caches (per worker)."""
     return {
-        "status": "ok", 
-        "vocab_size": len(vocab.get_allowed_tokens()),
-        "storage": storage_info,
+        "gloss": {**_gloss_stats, "size": len(_gloss_cache), "maxsize": _gloss_cache.maxsize},
+        "semantic": None if semantic_cache is None else {"size": len(semantic_cache), "maxsize": semantic_cache.maxsize},
+        "plan": _plan_cached.cache_info()._asdict(),
+        "landmarks": _landmark_payload.cache_info()._asdict(),
     }
 
-@app.post("/api/translate", response_model=TranslateResponse)
-def translate(req: GlossRequest):
+# TranslateResponse documents the schema only; the response is built from
+# trusted data, so it is returned directly instead of being re-validated.
+@app.post("/api/translate", responses={200: {"model": TranslateResponse}})
+async def translate(req: GlossRequest):
     # 1. Text to Gloss (Gemini) with language support
-    print(f"Translating: {req.text} (language: {req.language or 'auto-detect'})")
-    gloss_result = gemini.text_to_gloss(req.text, language=req.language)
+    logger.debug("Translating: %s (language: %s)", req.text, req.language or 'auto-detect')
+    gloss_result = await _cached_text_to_gloss(req.text, req.language)
     gloss_tokens = gloss_result.get("gloss", [])
     unmatched = gloss_result.get("unmatched", [])
     detected_language = gloss_result.get("detected_language")
     
     # 2. Gloss to Plan (Planner)
-    plan = build_render_plan(gloss_tokens)
+    plan = _plan_cached(tuple(gloss_tokens))
     
-    return {
+    return ORJSONResponse({
         "gloss": gloss_tokens,
         "unmatched": unmatched,
         "plan": plan,
         "notes": gloss_result.get("notes"),
         "detected_language": detected_language
-    }
+    })
 
-@app.get("/api/sign/{sign_name}/landmarks")
-def get_landmarks(sign_name: str):
-    """Return 3D full-body pose landmark frames for a sign."""
+# Landmark payloads are immutable, so they are encoded once and kept in memory.
+# PRELOAD_LANDMARKS=true encodes every sign in the vocabulary at startup.
+PRELOAD_LANDMARKS = os.environ.get("PRELOAD_LANDMARKS", "false").lower() == "true"
+LANDMARK_CACHE_SIZE = int(os.environ.get("LANDMARK_CACHE_SIZE", "2048"))
+PRELOAD_WORKERS = int(os.environ.get("PRELOAD_WORKERS", "8"))
+_preload_stop = threading.Event()
+
+
+# Landmark coordinates are sent as int16 (value * scale) for the q16/bin
+# encodings; the scale is reduced for signs whose coordinates would overflow.
+LANDMARK_Q16_SCALE = 10000
+
+LandmarkEncoding = Literal["json", "q16", "bin"]
+
+
+class LandmarkPayload(NamedTuple):
+    body: bytes  # encoded response
+    gzipped: bytes  # same body, gzip-compressed
+    etag: str
+    gzip_etag: str  # the gzipped body is a different representation
+    media_type: str
+    headers: Dict[str, str]  # extra response headers (binary layout for "bin")
+
+
+def _quantize_pose(frames: List[Dict[str, Any]]):
+    """Stack pose frames into an (F, 33, 3) int16 array. Returns (array, scale)."""
+    arr = np.asarray([frame["pose"] for frame in frames], dtype=np.float32)
+    max_abs = float(np.abs(arr).max()) if arr.size else 0.0
+    scale = LANDMARK_Q16_SCALE
+    if max_abs * scale > np.iinfo(np.int16).max:
+        scale = int(np.iinfo(np.int16).max // max_abs)
+    return np.round(arr * scale).astype(np.int16), scale
+
+
+@lru_cache(maxsize=LANDMARK_CACHE_SIZE)
+def _landmark_payload(sign_name: str, encoding: LandmarkEncoding = "json") -> LandmarkPayload:
+    """
+    Serialized landmarks response for a sign, plain and gzipped, plus its ETag.
+    Missing signs raise (and exceptions are not cached), so they are retried
+    on the next request.
+    
+    Args:
+        sign_name: Sign to load
+        encoding: "json" - pose_frames as nested float lists (default)
+                  "q16"  - JSON with a flat int16 list in pose_q16, plus shape and scale
+                  "bin"  - raw little-endian int16 bytes; shape and scale in headers
+    """
     pose_data = sign_mgr.get_sign_full_body_pose_frames(sign_name)
     
     if not pose_data:
         raise HTTPException(status_code=404, detail="Sign data not found")
     
-    response = {
-        "pose_frames": pose_data.get("frames", []),
-        "L_orig": pose_data.get("L_orig"),
-        "L_max": pose_data.get("L_max")
+    media_type = "application/json"
+    headers: Dict[str, str] = {}
+    if encoding == "json":
+        response = {
+            "pose_frames": pose_data.get("frames", []),
+            "L_orig": pose_data.get("L_orig"),
+            "L_max": pose_data.get("L_max")
+        }
+        body = orjson.dumps(response, option=orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        quantized, scale = _quantize_pose(pose_data.get("frames", []))
+        if encoding == "q16":
+            response = {
+                "pose_q16": quantized.ravel(),
+                "shape": quantized.shape,
+                "scale": scale,
+                "L_orig": pose_data.get("L_orig"),
+                "L_max": pose_data.get("L_max")
+            }
+            body = orjson.dumps(response, option=orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            body = quantized.astype("<i2").tobytes()
+            media_type = "application/octet-stream"
+            headers = {
+                "X-Landmark-Shape": ",".join(map(str, quantized.shape)),
+                "X-Landmark-Scale": str(scale),
+                "X-Landmark-L-Orig": str(pose_data.get("L_orig")),
+                "X-Landmark-L-Max": str(pose_data.get("L_max")),
+            }
+    
+    digest = hashlib.blake2b(body, digest_size=8).hexdigest()
+    return LandmarkPayload(body, gzip.compress(body, compresslevel=6, mtime=0),
+                           f'"{digest}"', f'"{digest}-gzip"', media_type, headers)
+
+
+def _preload_one(sign_name: str) -> bool:
+    if _preload_stop.is_set():
+        return False
+    try:
+        _landmark_payload(sign_name, "json")  # same cache key as get_landmarks()
+        return True
+    except HTTPException:
+        return False
+
+
+def _preload_landmarks():
+    """
+    Encode landmark payloads for every sign in the vocabulary.
+    Signs are loaded on a small thread pool so pickle reads (local disk or GCS
+    downloads, which release the GIL) overlap instead of running one by one.
+    """
+    sign_names = sorted(set(vocab.token_to_sign.values()))
+    with ThreadPoolExecutor(max_workers=PRELOAD_WORKERS, thread_name_prefix="landmark-preload") as pool:
+        loaded = sum(pool.map(_preload_one, sign_names))
+    logger.info("[App] Preloaded landmark payloads for %d signs", loaded)
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """
+    Whether an Accept-Encoding header allows gzip: listed (or covered by "*")
+    with a q-value above zero. Coding names are matched exactly, so "x-gzip"
+    does not count.
+    """
+    qvalues: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qvalues[coding] = q
+    return qvalues.get("gzip", qvalues.get("*", 0.0)) > 0
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Whether an If-None-Match header lists etag, using weak comparison."""
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+@app.get("/api/sign/{sign_name}/landmarks")
+def get_landmarks(sign_name: str, request: Request, encoding: LandmarkEncoding = "json"):
+    """
+    Return 3D full-body pose landmark frames for a sign.
+    Pass encoding=q16 or encoding=bin for int16-quantized coordinates
+    (divide by the returned scale to recover floats).
+    """
+    payload = _landmark_payload(sign_name, encoding)
+    use_gzip = _accepts_gzip(request.headers.get("accept-encoding", ""))
+    headers = {
+        "ETag": payload.gzip_etag if use_gzip else payload.etag,
+        "Cache-Control": "public, max-age=3600",
+        "Vary": "Accept-Encoding",
+        **payload.headers,
     }
     
-    return response
+    # Client already has this payload (e.g. replaying a sign): skip the body
+    if _etag_matches(request.headers.get("if-none-match", ""), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=payload.gzipped, media_type=payload.media_type, headers=headers)
+    return Response(content=payload.body, media_type=payload.media_type, headers=headers)
+
+
+# Upper bound in seconds on the fallback transcription call, so a hung
+# request fails fast instead of holding the client until the HTTP timeout
+TRANSCRIBE_FALLBACK_TIMEOUT = float(os.environ.get("TRANSCRIBE_FALLBACK_TIMEOUT", "10"))
 
 
 class TranscribeRequest(BaseModel):
-    audio_data: str  # Base64 encoded audio
+    audio_data: Base64Bytes  # Base64 encoded audio, decoded to bytes during validation
     mime_type: str = "audio/webm"
     language: Optional[str] = None  # Language code (e.g., 'en', 'zh', 'ms', 'ta'). If None, auto-detects.
     auto_translate: bool = False  # If True, automatically translate transcription to sign language
@@ -119,11 +413,13 @@ class TranscribeResponse(BaseModel):
     detected_language: Optional[str] = None  # Language code if auto-detected
     gloss: Optional[List[str]] = None  # Only included if auto_translate is True
     unmatched: Optional[List[str]] = None  # Only included if auto_translate is True
-    plan: Optional[List[Dict[str, Any]]] = None  # Only included if auto_translate is True
+    plan: Optional[List[RenderPlanItem]] = None  # Only included if auto_translate is True
     notes: Optional[str] = None  # Only included if auto_translate is True
 
 
-@app.post("/api/transcribe")
+# Like /api/translate, the response is returned directly (no re-validation or
+# jsonable_encoder pass); TranscribeResponse only documents the schema.
+@app.post("/api/transcribe", responses={200: {"model": TranscribeResponse}})
 async def transcribe_audio(req: TranscribeRequest):
     """
     Transcribe audio to text using Gemini Live API with automatic VAD.
@@ -133,49 +429,110 @@ async def transcribe_audio(req: TranscribeRequest):
     Args:
         req: TranscribeRequest with audio_data, mime_type, optional language, and auto_translate flag
     """
-    print(f"Received transcription request (audio mime_type: {req.mime_type}, language: {req.language or 'auto-detect'}, auto_translate: {req.auto_translate})")
+    return await _transcribe(req.audio_data, req.mime_type, req.language, req.auto_translate)
+
+
+@app.post("/api/transcribe/upload", responses={200: {"model": TranscribeResponse}})
+async def transcribe_audio_upload(
+    audio: UploadFile = File(...),
+    language: Optional[str] = Form(None),
+    auto_translate: bool = Form(False),
+):
+    """
+    Same as /api/transcribe, but takes the recording as a multipart file upload.
+    Avoids the ~33% base64 overhead on the wire and the decode step.
+    
+    Args:
+        audio: Audio file (its content type is used as the mime_type)
+        language: Optional language code. If omitted, auto-detects.
+        auto_translate: If True, also translate the transcription to sign language
+    """
+    audio_bytes = await audio.read()
+    mime_type = audio.content_type or "audio/webm"
+    return await _transcribe(audio_bytes, mime_type, language, auto_translate)
+
+
+async def _transcribe(audio_bytes: bytes, mime_type: str, language: Optional[str], auto_translate: bool):
+    logger.debug("Received transcription request (audio mime_type: %s, %d bytes, language: %s, auto_translate: %s)",
+                 mime_type, len(audio_bytes), language or 'auto-detect', auto_translate)
+
+    if not audio_bytes:
+        # Nothing was recorded; don't spend a Gemini call on it
+        return ORJSONResponse({"transcription": "", "detected_language": None})
+
+    if auto_translate:
+        # Transcribe and translate in one Gemini call; fall through to the
+        # two-step path below if the fused response is unusable
+        fused = await gemini.transcribe_and_gloss_async(audio_bytes, mime_type, language)
+        if "error" not in fused:
+            transcription = fused.get("transcription", "")
+            detected_language = fused.get("detected_language")
+            logger.debug("Transcription + gloss: %s -> %s (detected language: %s)", transcription, fused.get('gloss'), detected_language)
+            if not transcription:
+                # Nothing heard: same shape as the two-step path below
+                return ORJSONResponse({
+                    "transcription": transcription,
+                    "detected_language": detected_language
+                })
+            gloss_result = {k: fused.get(k) for k in ("gloss", "unmatched", "notes", "detected_language")}
+            _gloss_cache[(_normalize_text(transcription), detected_language or language)] = gloss_result
+            return ORJSONResponse({
+                "transcription": transcription,
+                "detected_language": detected_language,
+                "gloss": gloss_result["gloss"],
+                "unmatched": gloss_result["unmatched"],
+                "plan": _plan_cached(tuple(gloss_result["gloss"])),
+                "notes": gloss_result["notes"]
+            })
+        logger.warning("Fused transcription failed, using two-step path: %s", fused['error'])
     
     # Transcribe audio using Live API with VAD and language support
-    result = await gemini.transcribe_audio_live(req.audio_data, req.mime_type, req.language)
+    result = await gemini.transcribe_audio_live(audio_bytes, mime_type, language)
     
     if "error" in result:
         # Fallback to standard transcription method if Live API fails
-        print(f"Live API failed, falling back to standard transcription: {result['error']}")
-        result = gemini.transcribe_audio(req.audio_data, req.mime_type, req.language)
+        logger.warning("Live API failed, falling back to standard transcription: %s", result['error'])
+        try:
+            result = await asyncio.wait_for(
+                gemini.transcribe_audio_async(audio_bytes, mime_type, language),
+                timeout=TRANSCRIBE_FALLBACK_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=504, detail="Transcription timed out")
         if "error" in result:
             raise HTTPException(status_code=400, detail=result["error"])
     
     transcription = result.get("transcription", "")
     detected_language = result.get("detected_language")
-    print(f"Transcription: {transcription} (detected language: {detected_language})")
+    logger.debug("Transcription: %s (detected language: %s)", transcription, detected_language)
     
     # If auto_translate is enabled, automatically translate
-    if req.auto_translate and transcription:
-        print(f"Auto-translating: {transcription}")
+    if auto_translate and transcription:
+        logger.debug("Auto-translating: %s", transcription)
         # Use detected language if available, otherwise use provided language or auto-detect
-        translation_lang = detected_language or req.language
-        gloss_result = gemini.text_to_gloss(transcription, language=translation_lang)
+        translation_lang = detected_language or language
+        gloss_result = await _cached_text_to_gloss(transcription, translation_lang)
         gloss_tokens = gloss_result.get("gloss", [])
         unmatched = gloss_result.get("unmatched", [])
         
         # Build render plan
-        plan = build_render_plan(gloss_tokens)
+        plan = _plan_cached(tuple(gloss_tokens))
         
         # Return full translation response
-        return {
+        return ORJSONResponse({
             "transcription": transcription,
             "detected_language": detected_language,
             "gloss": gloss_tokens,
             "unmatched": unmatched,
             "plan": plan,
             "notes": gloss_result.get("notes")
-        }
+        })
     
     # Return just transcription with detected language
-    return {
+    return ORJSONResponse({
         "transcription": transcription,
         "detected_language": detected_language
-    }
+    })
 
 
 # Frontend is now served separately via Vite dev server (unmute-fe)
@@ -183,23 +540,39 @@ async def transcribe_audio(req: TranscribeRequest):
 
 # ============ WebRTC Signaling Server ============
 
+# Messages queued per connection before a slow peer is disconnected
+WS_SEND_QUEUE_SIZE = int(os.environ.get("WS_SEND_QUEUE_SIZE", "64"))
+
+
 class ConnectionManager:
-    """Manages WebSocket connections and rooms for WebRTC signaling."""
+    """
+    Manages WebSocket connections and rooms for WebRTC signaling.
+    
+    Each connection gets a bounded outbox drained by its own writer task, so
+    sending never blocks the sender's loop and a peer that stops reading can
+    only buffer WS_SEND_QUEUE_SIZE messages before it is disconnected.
+    """
     
     def __init__(self):
         # room_id -> set of WebSocket connections
-        self.rooms: Dict[str, Set[WebSocket]] = {}
+        self.rooms: DefaultDict[str, Set[WebSocket]] = defaultdict(set)
         # websocket -> (room_id, user_id)
         self.connections: Dict[WebSocket, tuple] = {}
+        # (room_id, user_id) -> WebSocket, for targeted relays
+        self.user_index: Dict[Tuple[str, str], WebSocket] = {}
+        # websocket -> (outbox, writer task)
+        self.outboxes: Dict[WebSocket, Tuple[asyncio.Queue, asyncio.Task]] = {}
+        # Close tasks for dropped peers, held so they aren't garbage collected
+        self.closers: Set[asyncio.Task] = set()
     
     async def join_room(self, websocket: WebSocket, room_id: str, user_id: str):
         await websocket.accept()
         
-        if room_id not in self.rooms:
-            self.rooms[room_id] = set()
-        
+        outbox: asyncio.Queue = asyncio.Queue(maxsize=WS_SEND_QUEUE_SIZE)
+        self.outboxes[websocket] = (outbox, asyncio.create_task(self._writer(websocket, outbox)))
         self.rooms[room_id].add(websocket)
         self.connections[websocket] = (room_id, user_id)
+        self.user_index[(room_id, user_id)] = websocket
         
         # Notify others in the room
         await self.broadcast_to_room(room_id, {
@@ -210,21 +583,26 @@ class ConnectionManager:
         }, exclude=websocket)
         
         # Send current users to the new joiner
-        await websocket.send_json({
+        self._send(websocket, orjson.dumps({
             "type": "room_info",
             "room_id": room_id,
             "user_count": len(self.rooms[room_id])
-        })
+        }).decode())
     
     async def leave_room(self, websocket: WebSocket):
         if websocket not in self.connections:
             return
         
-        room_id, user_id = self.connections[websocket]
+        room_id, user_id = self.connections.pop(websocket)
+        # A reconnect under the same user_id may already own the entry
+        if self.user_index.get((room_id, user_id)) is websocket:
+            del self.user_index[(room_id, user_id)]
+        self._stop_writer(websocket)
         
-        if room_id in self.rooms:
-            self.rooms[room_id].discard(websocket)
-            if not self.rooms[room_id]:
+        room = self.rooms.get(room_id)
+        if room is not None:
+            room.discard(websocket)
+            if not room:
                 del self.rooms[room_id]
             else:
                 await self.broadcast_to_room(room_id, {
@@ -232,19 +610,17 @@ class ConnectionManager:
                     "user_id": user_id,
                     "room_id": room_id
                 })
-        
-        del self.connections[websocket]
     
     async def broadcast_to_room(self, room_id: str, message: dict, exclude: WebSocket = None):
-        if room_id not in self.rooms:
+        room = self.rooms.get(room_id)
+        if not room:
             return
         
-        for connection in self.rooms[room_id]:
+        # Encode once; each peer's writer task does the actual send
+        payload = orjson.dumps(message).decode()
+        for connection in list(room):
             if connection != exclude:
-                try:
-                    await connection.send_json(message)
-                except:
-                    pass
+                self._send(connection, payload)
     
     async def relay_message(self, websocket: WebSocket, message: dict):
         """Relay signaling messages (offer, answer, ice-candidate) to peers."""
@@ -257,13 +633,63 @@ class ConnectionManager:
         # If target_id specified, send only to that user
         target_id = message.get("target_id")
         if target_id:
-            for conn, (r_id, u_id) in self.connections.items():
-                if r_id == room_id and u_id == target_id:
-                    await conn.send_json(message)
-                    return
+            target = self.user_index.get((room_id, target_id))
+            if target is not None:
+                self._send(target, orjson.dumps(message).decode())
+                return
         
         # Otherwise broadcast to all in room
         await self.broadcast_to_room(room_id, message, exclude=websocket)
+    
+    def _send(self, websocket: WebSocket, payload: str):
+        """Queue a text frame for a connection without waiting on the network."""
+        entry = self.outboxes.get(websocket)
+        if entry is None:
+            return
+        try:
+            entry[0].put_nowait(payload)
+        except asyncio.QueueFull:
+            # Peer isn't reading: cut it loose rather than buffer without bound.
+            # Its own handler sees the close and runs leave_room.
+            logger.warning("[WebRTC] Send queue full for %s, disconnecting", self.connections.get(websocket))
+            self._drop(websocket)
+            closer = asyncio.create_task(self._close(websocket, code=1013))
+            self.closers.add(closer)
+            closer.add_done_callback(self.closers.discard)
+    
+    async def _writer(self, websocket: WebSocket, outbox: asyncio.Queue):
+        try:
+            while True:
+                await websocket.send_text(await outbox.get())
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Stop routing messages to it and close it, so its handler's
+            # receive loop ends and leave_room notifies the rest of the room
+            logger.debug("[WebRTC] Send to %s failed: %s", self.connections.get(websocket), e)
+            self._drop(websocket)
+            await self._close(websocket, code=1011)
+    
+    def _drop(self, websocket: WebSocket):
+        """Stop sending to a connection; its room entry is removed right away."""
+        self._stop_writer(websocket)
+        entry = self.connections.get(websocket)
+        if entry is not None:
+            room = self.rooms.get(entry[0])
+            if room is not None:
+                room.discard(websocket)
+    
+    def _stop_writer(self, websocket: WebSocket):
+        entry = self.outboxes.pop(websocket, None)
+        if entry is not None and entry[1] is not asyncio.current_task():
+            entry[1].cancel()
+    
+    @staticmethod
+    async def _close(websocket: WebSocket, code: int):
+        try:
+            await websocket.close(code=code)
+        except Exception:
+            pass
 
 
 manager = ConnectionManager()
@@ -272,14 +698,14 @@ manager = ConnectionManager()
 @app.websocket("/ws/room/{room_id}/{user_id}")
 async def websocket_endpoint(websocket: WebSocket, room_id: str, user_id: str):
     """WebSocket endpoint for WebRTC signaling."""
-    print(f"[WebRTC] User {user_id} joining room {room_id}")
+    logger.debug("[WebRTC] User %s joining room %s", user_id, room_id)
     await manager.join_room(websocket, room_id, user_id)
     
     try:
         while True:
-            data = await websocket.receive_json()
+            data = orjson.loads(await websocket.receive_text())
             msg_type = data.get("type")
-            print(f"[WebRTC] Received {msg_type} from {user_id}")
+            logger.debug("[WebRTC] Received %s from %s", msg_type, user_id)
             
             if msg_type in ["offer", "answer", "ice-candidate"]:
                 # Relay WebRTC signaling messages
@@ -289,12 +715,13 @@ async def websocket_endpoint(websocket: WebSocket, room_id: str, user_id: str):
                 await manager.relay_message(websocket, data)
             elif msg_type == "sign-translation":
                 # Relay sign language translation to all other users in room
-                print(f"[WebRTC] Relaying sign translation from {user_id}")
+                logger.debug("[WebRTC] Relaying sign translation from %s", user_id)
                 await manager.relay_message(websocket, data)
     
     except WebSocketDisconnect:
-        print(f"[WebRTC] User {user_id} disconnected from room {room_id}")
-        await manager.leave_room(websocket)
+        logger.debug("[WebRTC] User %s disconnected from room %s", user_id, room_id)
     except Exception as e:
-        print(f"[WebRTC] WebSocket error: {e}")
+        logger.warning("[WebRTC] WebSocket error: %s", e)
+    finally:
+        # Also runs if the handler is cancelled, so the writer task never leaks
         await manager.leave_room(websocket)
@@ -0,0 +1,134 @@
+"""
+Request coalescing for text_to_gloss.
+
+Concurrent translate requests that arrive within a short window are grouped
+and sent to Gemini as one multi-input prompt, so a burst of N requests costs
+one round-trip (and one request against the RPM quota) instead of N.
+
+Environment Variables:
+    GLOSS_BATCH_MAX_SIZE: Maximum inputs per batched prompt (default: 16)
+    GLOSS_BATCH_WINDOW_MS: How long the first request in a batch waits for
+        others to join, in milliseconds (default: 25). 0 disables batching.
+"""
+
+import os
+import asyncio
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+GLOSS_BATCH_MAX_SIZE = int(os.environ.get("GLOSS_BATCH_MAX_SIZE", "16"))
+GLOSS_BATCH_WINDOW_MS = float(os.environ.get("GLOSS_BATCH_WINDOW_MS", "25"))
+
+# (text, language, future resolved with the gloss result)
+_Pending = Tuple[str, Optional[str], asyncio.Future]
+
+
+class BatchQueue:
+    def __init__(self, gemini, max_batch: int = GLOSS_BATCH_MAX_SIZE, window_ms: float = GLOSS_BATCH_WINDOW_MS):
+        self.gemini = gemini
+        self.max_batch = max(1, max_batch)
+        self.window = window_ms / 1000.0
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        # In-flight _dispatch tasks; referenced so they aren't garbage collected
+        self._tasks: Set[asyncio.Task] = set()
+
+    def start(self):
+        """Start the drain loop. Must be called from the running event loop."""
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """
+        Stop the drain loop and in-flight dispatches. Every request still
+        waiting in submit() fails with RuntimeError instead of hanging.
+        """
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        pending: List[_Pending] = []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        self._fail(pending, RuntimeError("Batch queue stopped"))
+
+    async def submit(self, text: str, language: Optional[str]) -> Dict[str, Any]:
+        """Queue a translation and wait for its result."""
+        if self._task is None:
+            # Not started (e.g. app used without its lifespan): call directly
+            return await self.gemini.text_to_gloss_async(text, language=language)
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, language, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        batch: List[_Pending] = []
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                deadline = loop.time() + self.window
+                while len(batch) < self.max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    # asyncio.timeout rather than wait_for: on 3.11 wait_for
+                    # can swallow stop()'s cancel when an item is ready
+                    try:
+                        async with asyncio.timeout(timeout):
+                            batch.append(await self._queue.get())
+                    except TimeoutError:
+                        break
+                # Dispatch without blocking collection of the next batch
+                task = asyncio.create_task(self._dispatch(batch))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+                batch = []
+        except asyncio.CancelledError:
+            # Requests already taken off the queue for the next batch
+            self._fail(batch, RuntimeError("Batch queue stopped"))
+            raise
+
+    async def _dispatch(self, batch: List[_Pending]):
+        try:
+            if len(batch) == 1:
+                text, language, _ = batch[0]
+                results = [await self.gemini.text_to_gloss_async(text, language=language)]
+            else:
+                items = [(text, language) for text, language, _ in batch]
+                results = await self.gemini.text_to_gloss_batch_async(items)
+
+            # Anything the batched call could not answer is retried on its own
+            missing = [i for i, result in enumerate(results) if result is None]
+            if missing:
+                retried = await asyncio.gather(*(
+                    self.gemini.text_to_gloss_async(batch[i][0], language=batch[i][1])
+                    for i in missing
+                ))
+                for i, result in zip(missing, retried):
+                    results[i] = result
+        except asyncio.CancelledError:
+            self._fail(batch, RuntimeError("Batch queue stopped"))
+            raise
+        except Exception as e:
+            self._fail(batch, e)
+            return
+
+        for (_, _, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    @staticmethod
+    def _fail(batch: List[_Pending], error: BaseException):
+        for _, _, future in batch:
+            if not future.done():
+                future.set_exception(error)
@@ -7,6 +7,9 @@ supporting both local filesystem (for development) and GCS (for production).
 Environment Variables:
     GCS_BUCKET_NAME: Name of the GCS bucket (e.g., 'unmute-datasets')
     USE_GCS: Set to 'true' to use GCS, otherwise uses local filesystem
+    GCS_POOL_SIZE: HTTP connections kept open to GCS (default: 64)
+    GCS_READ_CHUNK_SIZE: Bytes fetched per ranged read when streaming pickles
+        (default: 1 MiB; must be a multiple of 256 KiB)
 """
 
 import os
@@ -16,15 +19,26 @@ import json
 from typing import Optional, Any
 from functools import lru_cache
 
+from backend.paths import PROJECT_ROOT
+from backend.log import get_logger
+
+logger = get_logger(__name__)
+
 # Check if we should use GCS
 USE_GCS = os.environ.get("USE_GCS", "false").lower() == "true"
 GCS_BUCKET_NAME = os.environ.get("GCS_BUCKET_NAME", "unmute-datasets")
+# Matches the default THREAD_POOL_SIZE, so concurrent reads don't queue for a
+# connection (requests' default pool holds 10)
+GCS_POOL_SIZE = int(os.environ.get("GCS_POOL_SIZE", "64"))
+# BlobReader buffers a whole chunk (40 MiB by default), so without a bound a
+# pickle is held in memory in full either way
+GCS_READ_CHUNK_SIZE = int(os.environ.get("GCS_READ_CHUNK_SIZE", str(1024 * 1024)))
 
 # GCS public URL base (for static file serving)
 GCS_PUBLIC_URL = f"https://storage.googleapis.com/{GCS_BUCKET_NAME}"
 
 # Log configuration on module import
-print(f"[GCS Storage] USE_GCS={USE_GCS}, BUCKET={GCS_BUCKET_NAME}, PUBLIC_URL={GCS_PUBLIC_URL}")
+logger.info("[GCS Storage] USE_GCS=%s, BUCKET=%s, PUBLIC_URL=%s", USE_GCS, GCS_BUCKET_NAME, GCS_PUBLIC_URL)
 
 # Initialize GCS client only if needed
 _gcs_client = None
@@ -37,11 +51,15 @@ def _get_gcs_bucket():
     if _gcs_bucket is None and USE_GCS:
         try:
             from google.cloud import storage
+            from requests.adapters import HTTPAdapter
             _gcs_client = storage.Client()
+            # The client's authorized requests.Session is shared by all reads
+            adapter = HTTPAdapter(pool_connections=GCS_POOL_SIZE, pool_maxsize=GCS_POOL_SIZE)
+            _gcs_client._http.mount("https://", adapter)
             _gcs_bucket = _gcs_client.bucket(GCS_BUCKET_NAME)
-            print(f"[GCS] Connected to bucket: {GCS_BUCKET_NAME}")
+            logger.info("[GCS] Connected to bucket: %s", GCS_BUCKET_NAME)
         except Exception as e:
-            print(f"[GCS] Failed to connect to bucket: {e}")
+            logger.warning("[GCS] Failed to connect to bucket: %s", e)
             raise
     return _gcs_bucket
 
@@ -59,12 +77,12 @@ def get_static_url(relative_path: str) -> str:
     if USE_GCS:
         # Return GCS public URL
         url = f"{GCS_PUBLIC_URL}/{relative_path}"
-        print(f"[GCS] Generated URL: {url}")
+        logger.debug("[GCS] Generated URL: %s", url)
         return url
     else:
         # Return local static path
         url = f"/static/{relative_path}"
-        print(f"[Local] Generated URL: {url}")
+        logger.debug("[Local] Generated URL: %s", url)
         return url
 
 
@@ -82,15 +100,14 @@ def file_exists(relative_path: str, local_base_dir: str = None) -> bool:
             blob = bucket.blob(relative_path)
             return blob.exists()
         except Exception as e:
-            print(f"[GCS] Error checking file existence: {e}")
+            logger.warning("[GCS] Error checking file existence: %s", e)
             return False
     else:
         if local_base_dir:
             full_path = os.path.join(local_base_dir, relative_path)
         else:
             # Default to project root
-            project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            full_path = os.path.join(project_root, relative_path)
+            full_path = os.path.join(PROJECT_ROOT, relative_path)
         return os.path.exists(full_path)
 
 
@@ -109,17 +126,16 @@ def read_json(relative_path: str, local_base_dir: str = None) -> Optional[dict]:
         try:
             bucket = _get_gcs_bucket()
             blob = bucket.blob(relative_path)
-            content = blob.download_as_text()
-            return json.loads(content)
+            # json.loads takes the UTF-8 bytes directly; no separate text decode
+            return json.loads(blob.download_as_bytes())
         except Exception as e:
-            print(f"[GCS] Error reading JSON {relative_path}: {e}")
+            logger.warning("[GCS] Error reading JSON %s: %s", relative_path, e)
             return None
     else:
         if local_base_dir:
             full_path = os.path.join(local_base_dir, relative_path)
         else:
-            project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            full_path = os.path.join(project_root, relative_path)
+            full_path = os.path.join(PROJECT_ROOT, relative_path)
         
         if os.path.exists(full_path):
             with open(full_path, 'r', encoding='utf-8') as f:
@@ -142,17 +158,21 @@ def read_pickle(relative_path: str, local_base_dir: str = None) -> Optional[Any]
         try:
             bucket = _get_gcs_bucket()
             blob = bucket.blob(relative_path)
-            content = blob.download_as_bytes()
-            return pickle.loads(content)
+            # Unpickle from GCS_READ_CHUNK_SIZE ranged reads rather than holding
+            # the whole payload as bytes alongside the unpickled object. Pickles
+            # under one chunk still take a single request. Trade-off: ranged
+            # reads are not checked against the object's CRC32C the way
+            # download_as_bytes() is (truncation still fails in pickle.load).
+            with blob.open("rb", chunk_size=GCS_READ_CHUNK_SIZE) as fh:
+                return pickle.load(fh)
         except Exception as e:
-            print(f"[GCS] Error reading pickle {relative_path}: {e}")
+            logger.warning("[GCS] Error reading pickle %s: %s", relative_path, e)
             return None
     else:
         if local_base_dir:
             full_path = os.path.join(local_base_dir, relative_path)
         else:
-            project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            full_path = os.path.join(project_root, relative_path)
+            full_path = os.path.join(PROJECT_ROOT, relative_path)
         
         if os.path.exists(full_path):
             with open(full_path, 'rb') as f:
@@ -170,8 +190,14 @@ def read_pickle_cached(relative_path: str) -> Optional[Any]:
     return read_pickle(relative_path)
 
 
+@lru_cache(maxsize=1)
 def get_dataset_info() -> dict:
-    """Get information about the current storage configuration."""
+    """
+    Get information about the current storage configuration.
+    
+    The configuration is fixed at import time, so the dict is built once.
+    Callers must not mutate it.
+    """
     return {
         "use_gcs": USE_GCS,
         "bucket_name": GCS_BUCKET_NAME if USE_GCS else None,
@@ -1,13 +1,20 @@
 import os
+import importlib.util
 import json
-import base64
+import re
 from google import genai as genai_live
-from google.genai import types
-from typing import List, Dict, Any, Optional
+from google.genai import errors, types
+from typing import List, Dict, Any, Optional, Tuple
 import sys
 import asyncio
-import io
-from pydub import AudioSegment
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+import httpx
+import orjson
+from pydantic import BaseModel
 
 # Ensure backend can be imported if running as script
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -16,11 +23,206 @@ if parent_dir not in sys.path:
     sys.path.append(parent_dir)
 
 from backend.vocab import vocab
+from backend.log import get_logger
 from dotenv import load_dotenv
 
 # Load .env file
 load_dotenv(os.path.join(os.path.dirname(__file__), '.env'))
 
+logger = get_logger(__name__)
+
+GEMINI_MODEL = "gemini-3-flash-preview"
+
+EMBEDDING_MODEL = "gemini-embedding-001"
+EMBEDDING_CONFIG = types.EmbedContentConfig(
+    task_type="SEMANTIC_SIMILARITY",
+    output_dimensionality=768
+)
+
+
+# Response schemas. Gemini constrains its output to these, so responses are
+# always well-formed JSON (no markdown fences or prose around it), and the SDK
+# hands back the validated model as response.parsed.
+class GlossSchema(BaseModel):
+    gloss: List[str]
+    unmatched: List[str]
+    notes: Optional[str] = None
+    detected_language: Optional[str] = None
+
+
+class IndexedGlossSchema(BaseModel):
+    index: int
+    gloss: List[str]
+    unmatched: List[str]
+    notes: Optional[str] = None
+    detected_language: Optional[str] = None
+
+
+class BatchGlossSchema(BaseModel):
+    results: List[IndexedGlossSchema]
+
+
+class TranscribedGlossSchema(BaseModel):
+    # Field order is generation order: transcribe first, then translate
+    transcription: str
+    detected_language: Optional[str] = None
+    gloss: List[str]
+    unmatched: List[str]
+    notes: Optional[str] = None
+
+
+class TranscriptionSchema(BaseModel):
+    transcription: str
+    detected_language: Optional[str] = None
+
+
+TRANSCRIBE_CONFIG = types.GenerateContentConfig(
+    response_mime_type="application/json",
+    response_schema=TranscriptionSchema,
+    thinking_config=types.ThinkingConfig(thinking_level="low")
+)
+
+# Lifetime of the server-side context cache holding the gloss system prompt
+GLOSS_CACHE_TTL_SECONDS = 3600
+
+# Inputs up to this many words (and characters, for unspaced scripts such as
+# Chinese) are glossed with minimal thinking; longer ones get "low"
+SHORT_INPUT_WORDS = 4
+SHORT_INPUT_CHARS = 32
+
+# Transient API errors (408/429/5xx) are retried by the SDK with jittered
+# exponential backoff before they reach us
+RETRY_OPTIONS = types.HttpRetryOptions(attempts=3, initial_delay=0.2, max_delay=2.0, jitter=0.2)
+
+# Consecutive failed gloss requests before we stop calling Gemini, and for how long
+BREAKER_FAIL_MAX = 5
+BREAKER_RESET_SECONDS = 30
+
+GEMINI_UNAVAILABLE = "Gemini is temporarily unavailable, please try again shortly"
+
+LANGUAGE_NAMES = {
+    'en': 'English',
+    'zh': 'Chinese (Simplified or Traditional)',
+    'zh-CN': 'Chinese (Simplified)',
+    'zh-TW': 'Chinese (Traditional)',
+    'ms': 'Malay',
+    'ta': 'Tamil',
+    'hi': 'Hindi',
+    'es': 'Spanish',
+    'fr': 'French',
+    'de': 'German',
+    'ja': 'Japanese',
+    'ko': 'Korean'
+}
+
+GLOSS_CONSTRAINTS = """Important Constraints:
+        1. SGSL often uses Subject-Object-Verb (SOV) or Topic-Comment structure, different from English SVO.
+        2. You MUST use ONLY words from the provided vocabulary list below.
+        3. For words not in vocabulary, try synonyms (e.g., "MUM" -> "MOTHER", "Mama" -> "MOTHER").
+        4. Consider cultural context - SGSL reflects Singapore's multilingual environment.
+        5. For Chinese input: Consider tone and context; map to appropriate SGSL concepts.
+        6. For Malay/Tamil input: Translate meaningfully, not word-by-word.
+        7. If key concepts cannot be translated, include them in 'unmatched' array.
+        8. Preserve the semantic meaning and intent of the original text."""
+
+# Joins the vocabulary list in the gloss system instruction. Every token and
+# separator is billed on each uncached call; compare alternatives with
+# scripts/count_prompt_tokens.py before changing it.
+VOCAB_SEPARATOR = ", "
+
+
+# Everything str.isalnum() rejects except "_", i.e. what mock matching strips
+_NON_TOKEN_CHARS = re.compile(r"\W+")
+
+
+def _http_options() -> types.HttpOptions:
+    """
+    HTTP options for the Gemini client. When h2 is installed, httpx talks
+    HTTP/2, so concurrent requests from a worker share one multiplexed
+    TLS connection instead of opening one each.
+    """
+    client_args = {"http2": True} if importlib.util.find_spec("h2") is not None else None
+    return types.HttpOptions(
+        api_version="v1alpha",
+        client_args=client_args,
+        async_client_args=client_args,
+        retry_options=RETRY_OPTIONS
+    )
+
+
+class CircuitBreaker:
+    """
+    Fails Gemini requests fast while Gemini is down. After `fail_max`
+    consecutive outage errors (each already retried by the SDK) the breaker
+    opens and callers get an error without making a request. Once
+    `reset_timeout` seconds pass, one request is let through: success closes
+    the breaker, another failure keeps it open for a further timeout.
+    """
+
+    def __init__(self, fail_max: int = BREAKER_FAIL_MAX, reset_timeout: float = BREAKER_RESET_SECONDS):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - self._opened_at >= self.reset_timeout:
+                # Admit this trial request; the rest keep failing fast until it finishes
+                self._opened_at = now
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self, error: Exception):
+        """Count an error if it means Gemini is unavailable (not a bad request or response)."""
+        if not _is_outage(error):
+            return
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.fail_max:
+                if self._opened_at is None:
+                    logger.warning("Gemini failing (%s consecutive errors), pausing requests for %ss",
+                                   self._failures, self.reset_timeout)
+                self._opened_at = time.monotonic()
+
+
+def _is_outage(error: Exception) -> bool:
+    if isinstance(error, errors.ServerError) or isinstance(error, httpx.TransportError):
+        return True
+    return isinstance(error, errors.APIError) and error.code in (408, 429)
+
+
+def _is_cache_miss(error: Exception) -> bool:
+    """
+    Whether a request on the gloss context cache failed because the cache is
+    gone (expired or evicted server-side). Anything else, outages included,
+    would fail inline too, and the SDK has already retried it.
+    """
+    return isinstance(error, errors.ClientError) and error.code in (400, 404)
+
+
+def _thinking_level(text: str) -> str:
+    """Thinking level for glossing `text`: a few words need next to no reasoning."""
+    if len(text) <= SHORT_INPUT_CHARS and len(text.split()) <= SHORT_INPUT_WORDS:
+        return "minimal"
+    return "low"
+
+
+def _language_name(language: str) -> str:
+    """Human-readable name for a language code, or the code itself if unknown."""
+    return LANGUAGE_NAMES.get(language.lower(), language)
+
+
 class GeminiClient:
     def __init__(self, api_key: str = None):
         self.api_key = api_key or os.environ.get("GEMINI_API_KEY")
@@ -29,17 +231,51 @@ class GeminiClient:
         if self.api_key:
             self.client = genai_live.Client(
                 api_key=self.api_key,
-                http_options=types.HttpOptions(api_version="v1alpha")
+                http_options=_http_options()
             )
         else:
-            print("Warning: GEMINI_API_KEY not set. Using mock mode.")
+            logger.warning("GEMINI_API_KEY not set. Using mock mode.")
             self.client = None
+
+        # Explicit context cache for the gloss system prompt (see _ensure_gloss_cache)
+        self._gloss_cache_name: Optional[str] = None
+        self._gloss_cache_expires: Optional[datetime] = None
+        self._gloss_cache_retry_at: Optional[datetime] = None
+        self._gloss_cache_lock = threading.Lock()
+        # Serialises cache creation on the async client (see _ensure_gloss_cache_async)
+        self._gloss_cache_alock = asyncio.Lock()
+        # (allowed_tokens list, system instruction built from it)
+        self._last_system_instruction: Tuple[Optional[List[str]], str] = (None, "")
+        # (cache name, allowed_tokens list, {(response schema, thinking level): config built from them})
+        self._last_gloss_configs: Tuple[Optional[str], Optional[List[str]], Dict[Tuple[type, str], types.GenerateContentConfig]] = (None, None, {})
+        self._breaker = CircuitBreaker()
     
     @property
     def live_client(self):
         """Backward compatibility: live_client is the same as client"""
         return self.client
 
+    async def warmup(self):
+        """
+        Open the async client's connection to the Gemini API and prepare the
+        gloss context cache ahead of the first request, so it doesn't pay the
+        TLS handshake and cache creation. Uses a metadata call, so no tokens
+        are spent.
+        """
+        if not self.client:
+            return
+        try:
+            await self.client.aio.models.get(model=GEMINI_MODEL)
+        except Exception as e:
+            logger.warning("Gemini warmup failed: %s", e)
+            return
+        await self._ensure_gloss_cache_async()
+
+    async def aclose(self):
+        """Close the async client's HTTP connections (call on shutdown)."""
+        if self.client:
+            await self.client.aio.aclose()
+
     def text_to_gloss(self, text: str, allowed_tokens: List[str] = None, language: Optional[str] = None) -> Dict[str, Any]:
         """
         Translate text to gloss using permitted tokens.
@@ -61,31 +297,51 @@ class GeminiClient:
         if not self.client:
             return self._mock_response(text, allowed_tokens)
 
-        # Construct prompt
-        token_str = ", ".join(allowed_tokens)
-        
+        if not self._breaker.allow():
+            return {"gloss": [], "unmatched": [], "error": GEMINI_UNAVAILABLE}
+
+        try:
+            response = self._generate_gloss(
+                self._text_to_gloss_prompt(text, language), allowed_tokens, thinking_level=_thinking_level(text)
+            )
+            self._breaker.record_success()
+            return self._parse_gloss(response)
+        except Exception as e:
+            self._breaker.record_failure(e)
+            logger.exception("Gemini Error: %s", e)
+            return {"gloss": [], "unmatched": [], "error": str(e)}
+
+    async def text_to_gloss_async(self, text: str, allowed_tokens: List[str] = None, language: Optional[str] = None) -> Dict[str, Any]:
+        """text_to_gloss on the async HTTP client, without tying up a worker thread."""
+        if allowed_tokens is None:
+            allowed_tokens = vocab.get_allowed_tokens(text)
+
+        if not self.client:
+            return self._mock_response(text, allowed_tokens)
+
+        if not self._breaker.allow():
+            return {"gloss": [], "unmatched": [], "error": GEMINI_UNAVAILABLE}
+
+        try:
+            response = await self._generate_gloss_async(
+                self._text_to_gloss_prompt(text, language), allowed_tokens, thinking_level=_thinking_level(text)
+            )
+            self._breaker.record_success()
+            return self._parse_gloss(response)
+        except Exception as e:
+            self._breaker.record_failure(e)
+            logger.exception("Gemini Error: %s", e)
+            return {"gloss": [], "unmatched": [], "error": str(e)}
+
+    @staticmethod
+    def _text_to_gloss_prompt(text: str, language: Optional[str]) -> str:
         # Language-specific instructions
         language_instructions = ""
         if language:
-            lang_map = {
-                'en': 'English',
-                'zh': 'Chinese (Simplified or Traditional)',
-                'zh-CN': 'Chinese (Simplified)',
-                'zh-TW': 'Chinese (Traditional)',
-                'ms': 'Malay',
-                'ta': 'Tamil',
-                'hi': 'Hindi',
-                'es': 'Spanish',
-                'fr': 'French',
-                'de': 'German',
-                'ja': 'Japanese',
-                'ko': 'Korean'
-            }
-            lang_name = lang_map.get(language.lower(), language)
-            language_instructions = f"\n        Input Language: {lang_name}. Translate from {lang_name} to SGSL Gloss."
+            lang_name = _language_name(language)
+            language_instructions = f"Input Language: {lang_name}. Translate from {lang_name} to SGSL Gloss."
         else:
-            language_instructions = """
-        First, detect the input language automatically. The input may be in:
+            language_instructions = """First, detect the input language automatically. The input may be in:
         - English
         - Chinese (Simplified or Traditional)
         - Malay
@@ -96,84 +352,465 @@ class GeminiClient:
         Then translate from the detected language to SGSL Gloss."""
         
         prompt = f"""
+        {language_instructions}
+        
+        Input Text: "{text}"
+        
+        Output JSON format strictly (no markdown, no code blocks):
+        {{
+          "gloss": ["TOKEN1", "TOKEN2", ...],
+          "unmatched": ["word1", ...],
+          "notes": "Brief explanation of translation choices and detected language",
+          "detected_language": "language code if auto-detected"
+        }}
+        """
+        return prompt
+
+    def _parse_gloss(self, response) -> Dict[str, Any]:
+        """Validated gloss from a text_to_gloss response. Raises on empty/invalid JSON."""
+        return self.validate_gloss(self._response_data(response))
+
+    @staticmethod
+    def _response_data(response) -> Any:
+        """
+        JSON body of a response generated with a response_schema. The SDK has
+        already parsed and validated it into response.parsed; the raw text is
+        only parsed when that failed (e.g. a field the model left out).
+        """
+        if response.parsed is not None:
+            return response.parsed.model_dump()
+        text_resp = response.text
+        if not text_resp or not text_resp.strip():
+            raise ValueError("Empty response from Gemini API")
+        return orjson.loads(text_resp)
+
+    def text_to_gloss_batch(self, items: List[Tuple[str, Optional[str]]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Translate several (text, language) inputs with a single Gemini request.
+
+        Returns one result per input, in order. An entry is None when the model
+        omitted that input or the whole response could not be parsed; callers
+        should fall back to text_to_gloss for those. While Gemini is unavailable
+        every entry is an error result instead, so the batch fails once.
+        """
+        allowed_tokens = vocab.get_allowed_tokens()
+
+        if not self.client:
+            return [self._mock_response(text, allowed_tokens) for text, _ in items]
+
+        if not self._breaker.allow():
+            return self._batch_unavailable(len(items))
+
+        try:
+            response = self._generate_gloss(self._batch_prompt(items), allowed_tokens, BatchGlossSchema)
+            self._breaker.record_success()
+            return self._parse_batch(response, len(items))
+        except Exception as e:
+            self._breaker.record_failure(e)
+            logger.warning("Gemini Batch Error (%s inputs): %s", len(items), e)
+            if _is_outage(e):
+                # Retrying each input alone would only hit the outage again
+                return self._batch_unavailable(len(items))
+            return [None] * len(items)
+
+    async def text_to_gloss_batch_async(self, items: List[Tuple[str, Optional[str]]]) -> List[Optional[Dict[str, Any]]]:
+        """text_to_gloss_batch on the async HTTP client."""
+        allowed_tokens = vocab.get_allowed_tokens()
+
+        if not self.client:
+            return [self._mock_response(text, allowed_tokens) for text, _ in items]
+
+        if not self._breaker.allow():
+            return self._batch_unavailable(len(items))
+
+        try:
+            response = await self._generate_gloss_async(self._batch_prompt(items), allowed_tokens, BatchGlossSchema)
+            self._breaker.record_success()
+            return self._parse_batch(response, len(items))
+        except Exception as e:
+            self._breaker.record_failure(e)
+            logger.warning("Gemini Batch Error (%s inputs): %s", len(items), e)
+            if _is_outage(e):
+                # Retrying each input alone would only hit the outage again
+                return self._batch_unavailable(len(items))
+            return [None] * len(items)
+
+    @staticmethod
+    def _batch_unavailable(n: int) -> List[Dict[str, Any]]:
+        return [{"gloss": [], "unmatched": [], "error": GEMINI_UNAVAILABLE} for _ in range(n)]
+
+    @staticmethod
+    def _batch_prompt(items: List[Tuple[str, Optional[str]]]) -> str:
+        input_lines = []
+        for i, (text, language) in enumerate(items, start=1):
+            lang_name = _language_name(language) if language else "auto-detect"
+            input_lines.append(f"{i}. [language: {lang_name}] {json.dumps(text, ensure_ascii=False)}")
+        inputs_str = "\n        ".join(input_lines)
+
+        prompt = f"""
+        Translate EACH numbered input below into SGSL Gloss tokens.
+        Translate every input independently. Where the language is "auto-detect",
+        first detect the input language, then translate from it to SGSL Gloss.
+
+        Inputs:
+        {inputs_str}
+
+        Output JSON format strictly (no markdown, no code blocks), with one result per input:
+        {{
+          "results": [
+            {{
+              "index": 1,
+              "gloss": ["TOKEN1", "TOKEN2", ...],
+              "unmatched": ["word1", ...],
+              "notes": "Brief explanation of translation choices and detected language",
+              "detected_language": "language code if auto-detected"
+            }}
+          ]
+        }}
+        """
+
+        return prompt
+
+    def _parse_batch(self, response, n: int) -> List[Optional[Dict[str, Any]]]:
+        """One validated result per input index; None for inputs the model skipped."""
+        results: List[Optional[Dict[str, Any]]] = [None] * n
+        data = self._response_data(response)
+        for entry in data.get("results", []):
+            idx = entry.pop("index", None)
+            if isinstance(idx, int) and 1 <= idx <= n and results[idx - 1] is None:
+                results[idx - 1] = self.validate_gloss(entry)
+        return results
+
+    def _gloss_system_instruction(self, allowed_tokens: List[str]) -> str:
+        """
+        Static part of the gloss prompt: role, rules and vocabulary.
+        
+        vocab.get_allowed_tokens() hands out the same list every time, so the
+        instruction for the last list seen is kept and reused while it is
+        passed again (e.g. on the inline path when no context cache exists).
+        """
+        last_tokens, last_instruction = self._last_system_instruction
+        if allowed_tokens is last_tokens:
+            return last_instruction
+        token_str = VOCAB_SEPARATOR.join(allowed_tokens)
+        instruction = f"""
         You are a multilingual Singapore Sign Language (SGSL) translator.
         Your task is to translate text from ANY language into SGSL Gloss tokens.
-        {language_instructions}
         
-        Important Constraints:
-        1. SGSL often uses Subject-Object-Verb (SOV) or Topic-Comment structure, different from English SVO.
-        2. You MUST use ONLY words from the provided vocabulary list below.
-        3. For words not in vocabulary, try synonyms (e.g., "MUM" -> "MOTHER", "Mama" -> "MOTHER").
-        4. Consider cultural context - SGSL reflects Singapore's multilingual environment.
-        5. For Chinese input: Consider tone and context; map to appropriate SGSL concepts.
-        6. For Malay/Tamil input: Translate meaningfully, not word-by-word.
-        7. If key concepts cannot be translated, include them in 'unmatched' array.
-        8. Preserve the semantic meaning and intent of the original text.
+        {GLOSS_CONSTRAINTS}
         
         Vocabulary (use ONLY these tokens):
         [{token_str}]
+        """
+        self._last_system_instruction = (allowed_tokens, instruction)
+        return instruction
+
+    def _ensure_gloss_cache(self) -> Optional[str]:
+        """
+        Return the name of a Gemini context cache holding the gloss system
+        instruction for the full vocabulary, creating or refreshing it as needed.
+
+        The vocabulary block is identical for every request, so pinning it
+        server-side means each call only sends the input text, and the cached
+        tokens are billed at the discounted rate. Returns None if caching is
+        unavailable; callers then send the instruction inline.
+        """
+        now = datetime.now(timezone.utc)
+        with self._gloss_cache_lock:
+            if self._gloss_cache_name and self._gloss_cache_expires and now < self._gloss_cache_expires:
+                return self._gloss_cache_name
+            if self._gloss_cache_retry_at and now < self._gloss_cache_retry_at:
+                return None
+
+            try:
+                cache = self.client.caches.create(model=GEMINI_MODEL, config=self._gloss_cache_config())
+            except Exception as e:
+                return self._gloss_cache_failed(now, e)
+            return self._gloss_cache_created(cache, now)
+
+    async def _ensure_gloss_cache_async(self) -> Optional[str]:
+        """_ensure_gloss_cache on the async client (client.aio)."""
+        async with self._gloss_cache_alock:
+            now = datetime.now(timezone.utc)
+            with self._gloss_cache_lock:
+                if self._gloss_cache_name and self._gloss_cache_expires and now < self._gloss_cache_expires:
+                    return self._gloss_cache_name
+                if self._gloss_cache_retry_at and now < self._gloss_cache_retry_at:
+                    return None
+
+            try:
+                cache = await self.client.aio.caches.create(model=GEMINI_MODEL, config=self._gloss_cache_config())
+            except Exception as e:
+                with self._gloss_cache_lock:
+                    return self._gloss_cache_failed(now, e)
+            with self._gloss_cache_lock:
+                return self._gloss_cache_created(cache, now)
+
+    def _gloss_cache_config(self) -> types.CreateCachedContentConfig:
+        return types.CreateCachedContentConfig(
+            display_name="unmute-gloss-system-prompt",
+            system_instruction=self._gloss_system_instruction(vocab.get_allowed_tokens()),
+            ttl=f"{GLOSS_CACHE_TTL_SECONDS}s"
+        )
+
+    def _gloss_cache_failed(self, now: datetime, error: Exception) -> None:
+        """Go inline and back off for a while; call with _gloss_cache_lock held."""
+        logger.warning("Gemini context cache unavailable, sending prompt inline: %s", error)
+        self._gloss_cache_name = None
+        self._gloss_cache_retry_at = now + timedelta(minutes=10)
+        return None
+
+    def _gloss_cache_created(self, cache, now: datetime) -> str:
+        """Record a newly created cache; call with _gloss_cache_lock held."""
+        # Refresh a minute early so requests never reference an expired cache
+        expires = cache.expire_time or now + timedelta(seconds=GLOSS_CACHE_TTL_SECONDS)
+        self._gloss_cache_name = cache.name
+        self._gloss_cache_expires = expires - timedelta(seconds=60)
+        logger.info("Created Gemini context cache %s", cache.name)
+        return self._gloss_cache_name
+
+    def _generate_gloss(self, contents, allowed_tokens: List[str], schema: type = GlossSchema, thinking_level: str = "low"):
+        """
+        Run a gloss generation request. The system instruction comes from the
+        context cache when the full vocabulary is in use, otherwise inline.
         
-        Input Text: "{text}"
+        Args:
+            contents: Prompt string, or a list of types.Content for multimodal input
+            allowed_tokens: Vocabulary the system instruction restricts output to
+            schema: Response schema the output must follow
+            thinking_level: Gemini thinking level ("minimal" for trivial inputs)
+        """
+        cache_name = None
+        if allowed_tokens is vocab.get_allowed_tokens():
+            cache_name = self._ensure_gloss_cache()
+
+        if cache_name:
+            try:
+                return self.client.models.generate_content(
+                    model=GEMINI_MODEL,
+                    contents=contents,
+                    config=self._gloss_config(cache_name, allowed_tokens, schema, thinking_level)
+                )
+            except Exception as e:
+                if not _is_cache_miss(e):
+                    raise
+                self._drop_gloss_cache(cache_name, e)
+
+        return self.client.models.generate_content(
+            model=GEMINI_MODEL,
+            contents=contents,
+            config=self._gloss_config(None, allowed_tokens, schema, thinking_level)
+        )
+
+    async def _generate_gloss_async(self, contents, allowed_tokens: List[str], schema: type = GlossSchema, thinking_level: str = "low"):
+        """_generate_gloss on the async client (client.aio)."""
+        cache_name = None
+        if allowed_tokens is vocab.get_allowed_tokens():
+            cache_name = self._live_gloss_cache() or await self._ensure_gloss_cache_async()
+
+        if cache_name:
+            try:
+                return await self.client.aio.models.generate_content(
+                    model=GEMINI_MODEL,
+                    contents=contents,
+                    config=self._gloss_config(cache_name, allowed_tokens, schema, thinking_level)
+                )
+            except Exception as e:
+                if not _is_cache_miss(e):
+                    raise
+                self._drop_gloss_cache(cache_name, e)
+
+        return await self.client.aio.models.generate_content(
+            model=GEMINI_MODEL,
+            contents=contents,
+            config=self._gloss_config(None, allowed_tokens, schema, thinking_level)
+        )
+
+    def _gloss_config(self, cache_name: Optional[str], allowed_tokens: List[str], schema: type, thinking_level: str) -> types.GenerateContentConfig:
+        """
+        Generation config for gloss requests, using the context cache when given
+        one. Configs for the last (cache, vocabulary) pair are reused, one per
+        (response schema, thinking level), since both only change when the
+        context cache is refreshed.
+        """
+        last_cache, last_tokens, configs = self._last_gloss_configs
+        if not (cache_name == last_cache and (cache_name or allowed_tokens is last_tokens)):
+            configs = {}
+            self._last_gloss_configs = (cache_name, allowed_tokens, configs)
+        config = configs.get((schema, thinking_level))
+        if config is not None:
+            return config
+        if cache_name:
+            config = types.GenerateContentConfig(
+                cached_content=cache_name,
+                response_mime_type="application/json",
+                response_schema=schema,
+                thinking_config=types.ThinkingConfig(thinking_level=thinking_level)
+            )
+        else:
+            config = types.GenerateContentConfig(
+                system_instruction=self._gloss_system_instruction(allowed_tokens),
+                response_mime_type="application/json",
+                response_schema=schema,
+                thinking_config=types.ThinkingConfig(thinking_level=thinking_level)
+            )
+        configs[(schema, thinking_level)] = config
+        return config
+
+    def _live_gloss_cache(self) -> Optional[str]:
+        """The current context cache name if it is still valid, without creating one."""
+        with self._gloss_cache_lock:
+            if self._gloss_cache_name and self._gloss_cache_expires and datetime.now(timezone.utc) < self._gloss_cache_expires:
+                return self._gloss_cache_name
+        return None
+
+    def _drop_gloss_cache(self, cache_name: str, error: Exception):
+        # Cache was evicted server-side; drop it and go inline
+        logger.warning("Gemini context cache missing, retrying inline: %s", error)
+        with self._gloss_cache_lock:
+            if self._gloss_cache_name == cache_name:
+                self._gloss_cache_name = None
+
+    def transcribe_and_gloss(self, audio_bytes: bytes, mime_type: str = "audio/webm", language: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Transcribe audio and translate it to SGSL gloss in a single Gemini call.
+        Used by /api/transcribe with auto_translate, saving the second round-trip
+        of transcribe_audio followed by text_to_gloss.
+        
+        Args:
+            audio_bytes: Raw (already decoded) audio data
+            mime_type: MIME type of the audio (default: "audio/webm")
+            language: Optional language code of the speech. If None, auto-detects.
+        
+        Returns a dict with transcription, detected_language, gloss, unmatched and
+        notes, or a dict with an "error" key; callers should then fall back to the
+        two-step path.
+        """
+        if not self.client:
+            return {"transcription": "", "error": "No API key - audio transcription requires Gemini API"}
+
+        if not self._breaker.allow():
+            return {"transcription": "", "error": GEMINI_UNAVAILABLE}
+
+        try:
+            response = self._generate_gloss(
+                self._transcribe_and_gloss_contents(audio_bytes, mime_type, language), vocab.get_allowed_tokens(), TranscribedGlossSchema
+            )
+            self._breaker.record_success()
+            return self._parse_transcribe_and_gloss(response)
+        except Exception as e:
+            self._breaker.record_failure(e)
+            logger.warning("Gemini Fused Transcribe Error: %s", e)
+            return {"transcription": "", "error": str(e)}
+
+    async def transcribe_and_gloss_async(self, audio_bytes: bytes, mime_type: str = "audio/webm", language: Optional[str] = None) -> Dict[str, Any]:
+        """transcribe_and_gloss on the async HTTP client."""
+        if not self.client:
+            return {"transcription": "", "error": "No API key - audio transcription requires Gemini API"}
+
+        if not self._breaker.allow():
+            return {"transcription": "", "error": GEMINI_UNAVAILABLE}
+
+        try:
+            response = await self._generate_gloss_async(
+                self._transcribe_and_gloss_contents(audio_bytes, mime_type, language), vocab.get_allowed_tokens(), TranscribedGlossSchema
+            )
+            self._breaker.record_success()
+            return self._parse_transcribe_and_gloss(response)
+        except Exception as e:
+            self._breaker.record_failure(e)
+            logger.warning("Gemini Fused Transcribe Error: %s", e)
+            return {"transcription": "", "error": str(e)}
+
+    @staticmethod
+    def _transcribe_and_gloss_contents(audio_bytes: bytes, mime_type: str, language: Optional[str]) -> List[types.Content]:
+        return [
+            types.Content(
+                role="user",
+                parts=[
+                    GeminiClient._transcribe_and_gloss_prompt(language),
+                    types.Part(inline_data=types.Blob(mime_type=mime_type, data=audio_bytes))
+                ]
+            )
+        ]
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _transcribe_and_gloss_prompt(language: Optional[str]) -> types.Part:
+        """Prompt part for transcribe_and_gloss; only depends on the language."""
+        if language:
+            lang_name = _language_name(language)
+            language_instructions = f"The speech is in {lang_name}. Transcribe it in {lang_name} (do not translate the transcription to English), then translate from {lang_name} to SGSL Gloss."
+        else:
+            language_instructions = "Automatically detect the spoken language. Transcribe it in the original language (do not translate the transcription to English), then translate from the detected language to SGSL Gloss."
+
+        prompt = f"""
+        Listen to the provided audio carefully and transcribe it exactly as spoken,
+        with punctuation and capitalization as appropriate. If no speech is detected,
+        return an empty transcription and an empty gloss.
+        
+        {language_instructions}
         
         Output JSON format strictly (no markdown, no code blocks):
         {{
+          "transcription": "The spoken text in original language",
+          "detected_language": "language code (e.g., 'en', 'zh', 'ms', 'ta')",
           "gloss": ["TOKEN1", "TOKEN2", ...],
           "unmatched": ["word1", ...],
-          "notes": "Brief explanation of translation choices and detected language",
-          "detected_language": "language code if auto-detected"
+          "notes": "Brief explanation of translation choices"
         }}
         """
-        
+        return types.Part(text=prompt)
+
+    def _parse_transcribe_and_gloss(self, response) -> Dict[str, Any]:
+        data = self._response_data(response)
+        if not isinstance(data, dict) or not isinstance(data.get("transcription"), str):
+            raise ValueError("Response is missing the transcription field")
+        return self.validate_gloss(data)
+
+    def embed_text(self, text: str) -> Optional[List[float]]:
+        """
+        Embed text for semantic similarity lookups (see backend/semantic_cache.py).
+        Returns None in mock mode or if the embedding call fails.
+        """
+        if not self.client:
+            return None
+
         try:
-            # Use new google.genai Client API
-            # Using gemini-3-flash-preview for better performance, but can use gemini-2.0-flash if preferred
-            response = self.client.models.generate_content(
-                model="gemini-3-flash-preview",
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    response_mime_type="application/json",
-                    thinking_config=types.ThinkingConfig(thinking_level="low")  # Use low for faster response
-                )
+            response = self.client.models.embed_content(
+                model=EMBEDDING_MODEL, contents=text, config=EMBEDDING_CONFIG
             )
-            
-            # Extract text from response
-            # The new google.genai API returns response.text directly
-            text_resp = response.text
-            
-            if not text_resp or not text_resp.strip():
-                raise ValueError("Empty response from Gemini API")
-            
-            # Parse JSON
-            data = json.loads(text_resp)
-            return self.validate_gloss(data)
+            return response.embeddings[0].values
         except Exception as e:
-            print(f"Gemini Error: {e}")
-            import traceback
-            traceback.print_exc()
-            return {"gloss": [], "unmatched": [], "error": str(e)}
+            logger.warning("Gemini Embedding Error: %s", e)
+            return None
+
+    async def embed_text_async(self, text: str) -> Optional[List[float]]:
+        """embed_text on the async HTTP client."""
+        if not self.client:
+            return None
+
+        try:
+            response = await self.client.aio.models.embed_content(
+                model=EMBEDDING_MODEL, contents=text, config=EMBEDDING_CONFIG
+            )
+            return response.embeddings[0].values
+        except Exception as e:
+            logger.warning("Gemini Embedding Error: %s", e)
+            return None
 
     def validate_gloss(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Ensure all tokens in gloss are actually in vocab.
         """
         raw_gloss = data.get("gloss", [])
-        validated_gloss = []
         unmatched = data.get("unmatched", [])
         
-        for token in raw_gloss:
-            # 1. Canonicalize
-            canon_token = vocab.canon(token)
-            
-            # 2. Check alias
-            canon_token = vocab.apply_aliases(canon_token)
-            
-            # 3. Check exist
-            if vocab.validate_token(canon_token):
-                validated_gloss.append(canon_token)
-            else:
-                # Fallback: maybe it's a synonym not in alias list?
-                # For now, mark as unmatched
-                unmatched.append(token)
+        # Canonicalize, apply aliases and check the vocabulary in one memoized
+        # lookup per token; tokens outside the vocabulary are marked unmatched
+        resolved = [vocab.resolve_token(token) for token in raw_gloss]
+        validated_gloss = [r for r in resolved if r is not None]
+        unmatched.extend(token for token, r in zip(raw_gloss, resolved) if r is None)
         
         data["gloss"] = validated_gloss
         data["unmatched"] = unmatched
@@ -185,10 +822,15 @@ class GeminiClient:
         gloss = []
         unmatched = []
         
-        vocab_set = set(allowed_tokens)
+        # The full vocabulary is already a dict keyed by token; only an
+        # explicit subset needs its own set
+        if allowed_tokens is vocab.get_allowed_tokens():
+            vocab_set = vocab.token_to_sign
+        else:
+            vocab_set = set(allowed_tokens)
         
         for w in words:
-            clean = "".join(c for c in w if c.isalnum() or c=='_')
+            clean = _NON_TOKEN_CHARS.sub("", w)
             clean = vocab.apply_aliases(clean)
             
             if clean in vocab_set:
@@ -202,60 +844,30 @@ class GeminiClient:
             "notes": "Mock response (no API key)"
         }
 
-    def _convert_audio_to_pcm(self, audio_bytes: bytes, mime_type: str) -> bytes:
-        """
-        Convert audio bytes to PCM format (16-bit, little-endian, 16kHz).
-        Supports WebM, WAV, and other formats via pydub.
-        """
-        try:
-            # Extract format from mime_type (e.g., "audio/webm" -> "webm")
-            format_str = mime_type.split(';')[0].split('/')[-1]
-            if format_str not in ['webm', 'wav', 'mp3', 'ogg', 'm4a', 'flac']:
-                # Try to detect format or default to webm
-                format_str = 'webm'
-            
-            # Create AudioSegment from bytes
-            audio = AudioSegment.from_file(io.BytesIO(audio_bytes), format=format_str)
-            
-            # Convert to PCM: 16-bit, mono, 16kHz
-            audio = audio.set_frame_rate(16000)
-            audio = audio.set_channels(1)
-            audio = audio.set_sample_width(2)  # 16-bit = 2 bytes
-            
-            # Export as raw PCM (little-endian)
-            pcm_bytes = audio.raw_data
-            return pcm_bytes
-            
-        except Exception as e:
-            print(f"Error converting audio to PCM: {e}")
-            raise  # Re-raise to allow fallback handling
-
-    async def transcribe_audio_live(self, audio_base64: str, mime_type: str = "audio/webm", language: Optional[str] = None) -> Dict[str, Any]:
+    async def transcribe_audio_live(self, audio_bytes: bytes, mime_type: str = "audio/webm", language: Optional[str] = None) -> Dict[str, Any]:
         """
         Transcribe audio using standard Gemini API.
         This method uses the standard generate_content API for reliable transcription.
         Maintains async interface for compatibility with endpoint.
         
         Args:
-            audio_base64: Base64 encoded audio data
+            audio_bytes: Raw (already decoded) audio data
             mime_type: MIME type of the audio (default: "audio/webm")
             language: Optional language code for transcription
         """
-        # Use the working standard transcription method
-        # Run it in a thread pool to maintain async interface
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.transcribe_audio, audio_base64, mime_type, language)
+        # Use the working standard transcription method, on the async client
+        return await self.transcribe_audio_async(audio_bytes, mime_type, language)
 
-    def transcribe_audio(self, audio_base64: str, mime_type: str = "audio/webm", language: Optional[str] = None) -> Dict[str, Any]:
+    def transcribe_audio(self, audio_bytes: bytes, mime_type: str = "audio/webm", language: Optional[str] = None) -> Dict[str, Any]:
         """
         Transcribe audio to text using Gemini's multimodal capabilities.
         Supports multiple languages: English, Chinese (Simplified/Traditional), 
         Malay, Tamil, Hindi, and others. Auto-detects language if not specified.
         
-        Uses google.genai Client API with gemini-3-flash-preview.
+        Uses google.genai Client API with GEMINI_MODEL.
         
         Args:
-            audio_base64: Base64 encoded audio data
+            audio_bytes: Raw (already decoded) audio data
             mime_type: MIME type of the audio (default: "audio/webm")
             language: Optional language code (e.g., 'en', 'zh', 'ms', 'ta').
                      If None, language is auto-detected from audio.
@@ -265,33 +877,73 @@ class GeminiClient:
                 "transcription": "",
                 "error": "No API key - audio transcription requires Gemini API"
             }
-        
+
+        if not self._breaker.allow():
+            return {"transcription": "", "error": GEMINI_UNAVAILABLE}
+
+        response = None
         try:
-            audio_bytes = base64.b64decode(audio_base64)
+            # Use new google.genai Client API for transcription
+            response = self.client.models.generate_content(
+                model=GEMINI_MODEL,
+                contents=self._transcription_contents(audio_bytes, mime_type, language),
+                config=TRANSCRIBE_CONFIG
+            )
+            self._breaker.record_success()
+            return self._parse_transcription(response)
         except Exception as e:
+            self._breaker.record_failure(e)
+            return self._transcription_error(response, e)
+
+    async def transcribe_audio_async(self, audio_bytes: bytes, mime_type: str = "audio/webm", language: Optional[str] = None) -> Dict[str, Any]:
+        """transcribe_audio on the async HTTP client."""
+        if not self.client:
             return {
                 "transcription": "",
-                "error": f"Failed to decode audio: {str(e)}"
+                "error": "No API key - audio transcription requires Gemini API"
             }
-        
+
+        if not self._breaker.allow():
+            return {"transcription": "", "error": GEMINI_UNAVAILABLE}
+
+        response = None
+        try:
+            response = await self.client.aio.models.generate_content(
+                model=GEMINI_MODEL,
+                contents=self._transcription_contents(audio_bytes, mime_type, language),
+                config=TRANSCRIBE_CONFIG
+            )
+            self._breaker.record_success()
+            return self._parse_transcription(response)
+        except Exception as e:
+            self._breaker.record_failure(e)
+            return self._transcription_error(response, e)
+
+    @staticmethod
+    def _transcription_contents(audio_bytes: bytes, mime_type: str, language: Optional[str]) -> List[types.Content]:
+        return [
+            types.Content(
+                role="user",
+                parts=[
+                    GeminiClient._transcription_prompt(language),
+                    types.Part(
+                        inline_data=types.Blob(
+                            mime_type=mime_type,
+                            data=audio_bytes
+                        )
+                    )
+                ]
+            )
+        ]
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _transcription_prompt(language: Optional[str]) -> types.Part:
+        """Prompt part for transcribe_audio; only depends on the language."""
         # Language-specific instructions
         language_instructions = ""
         if language:
-            lang_map = {
-                'en': 'English',
-                'zh': 'Chinese (Simplified or Traditional)',
-                'zh-CN': 'Chinese (Simplified)',
-                'zh-TW': 'Chinese (Traditional)',
-                'ms': 'Malay',
-                'ta': 'Tamil',
-                'hi': 'Hindi',
-                'es': 'Spanish',
-                'fr': 'French',
-                'de': 'German',
-                'ja': 'Japanese',
-                'ko': 'Korean'
-            }
-            lang_name = lang_map.get(language.lower(), language)
+            lang_name = _language_name(language)
             language_instructions = f"Transcribe the audio in {lang_name}. Output the transcription in the original language (do not translate to English)."
         else:
             language_instructions = """Automatically detect the spoken language from the audio. The audio may contain:
@@ -324,48 +976,23 @@ class GeminiClient:
           "detected_language": "language code if auto-detected (e.g., 'en', 'zh', 'ms', 'ta')"
         }}
         """
-        
+        return types.Part(text=prompt)
+
+    @staticmethod
+    def _parse_transcription(response) -> Dict[str, Any]:
+        logger.debug("Gemini Transcription Response: %s", response.text)
+        return GeminiClient._response_data(response)
+
+    @staticmethod
+    def _transcription_error(response, e: Exception) -> Dict[str, Any]:
+        logger.exception("Gemini Audio Error: %s", e)
+        # If JSON generation fails or refusal occurs, try to extract text from raw response
         try:
-            # Use new google.genai Client API for transcription
-            response = self.client.models.generate_content(
-                model="gemini-3-flash-preview",
-                contents=[
-                    types.Content(
-                        role="user",
-                        parts=[
-                            types.Part(text=prompt),
-                            types.Part(
-                                inline_data=types.Blob(
-                                    mime_type=mime_type,
-                                    data=audio_bytes
-                                )
-                            )
-                        ]
-                    )
-                ],
-                config=types.GenerateContentConfig(
-                    response_mime_type="application/json",
-                    thinking_config=types.ThinkingConfig(thinking_level="low")
-                )
-            )
-            
-            text_resp = response.text
-            print(f"Gemini Transcription Response: {text_resp}")
-            
-            data = json.loads(text_resp)
-            return data
-            
-        except Exception as e:
-            print(f"Gemini Audio Error: {e}")
-            import traceback
-            traceback.print_exc()
-            # If JSON generation fails or refusal occurs, try to extract text from raw response
-            try:
-                if hasattr(response, 'text') and response.text:
-                    return {"transcription": response.text.strip()}
-            except:
-                pass
-            return {
-                "transcription": "",
-                "error": str(e)
-            }
+            if hasattr(response, 'text') and response.text:
+                return {"transcription": response.text.strip()}
+        except:
+            pass
+        return {
+            "transcription": "",
+            "error": str(e)
+        }
@@ -11,18 +11,94 @@ Features:
 - Wrist location features
 
 Output: 388-dim embedding (378 temporal stats + 10 wrist location stats)
+
+Environment Variables:
+    HAND_EMBED_CACHE_DIR: Optional directory for caching embeddings on disk as .npy files
 """
 
 from __future__ import annotations
 
 import os
+import hashlib
+import queue
+import threading
 import numpy as np
 import cv2
+from cachetools import LRUCache
+from numba import njit
 from PIL import Image
 import mediapipe as mp
 from mediapipe.tasks import python as mp_tasks
 from mediapipe.tasks.python import vision as mp_vision
 
+# Frames wider than this are downscaled (aspect preserved) before detection.
+# Landmarks are in normalised image coordinates, so this does not change scale.
+MAX_FRAME_WIDTH = 640
+
+# Decoded frames buffered ahead of landmark detection
+PREFETCH_FRAMES = 16
+
+HAND_EMBED_CACHE_DIR = os.environ.get("HAND_EMBED_CACHE_DIR")
+
+# Embeddings kept in memory per HandEmbedder (388 float32s, ~1.5 KB each)
+MEMORY_CACHE_SIZE = 512
+
+_DONE = object()
+
+
+def _prefetch(frames, maxsize: int = PREFETCH_FRAMES):
+    """
+    Run a frame generator on a background thread, buffering up to `maxsize`
+    items in a queue. cv2/PIL decoding and MediaPipe inference both release
+    the GIL, so the next frames are decoded while the current one is being
+    detected. Exceptions raised while decoding are re-raised to the caller.
+    """
+    q: queue.Queue = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        # Give up once the consumer has stopped, instead of blocking forever
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for item in frames:
+                if not put(item):
+                    break
+        except Exception as e:
+            put(e)
+        finally:
+            frames.close()  # releases the decoder if we stopped early
+            put(_DONE)
+
+    threading.Thread(target=produce, name="frame-prefetch", daemon=True).start()
+    try:
+        while True:
+            item = q.get()
+            if item is _DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+
+
+@njit(cache=True)
+def _ema_kernel(X, a, b):
+    """Y[t] = a * X[t] + b * Y[t - 1], compiled so the time loop runs in machine code."""
+    Y = X.copy()
+    for t in range(1, Y.shape[0]):
+        for d in range(Y.shape[1]):
+            Y[t, d] = a * Y[t, d] + b * Y[t - 1, d]
+    return Y
+
 
 class HandEmbedder:
     """
@@ -40,12 +116,19 @@ class HandEmbedder:
         max_seconds: float = 4.0,
         ema_alpha: float = 0.65,
         model_path: str | None = None,
+        cache_dir: str | None = HAND_EMBED_CACHE_DIR,
     ):
         self.target_frames = target_frames
         self.sample_fps = sample_fps
         self.max_seconds = max_seconds
         self.ema_alpha = ema_alpha
 
+        # Embeddings by file + settings (see _cached); disk cache only if cache_dir is set
+        self.cache_dir = cache_dir
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        self._memory_cache: LRUCache = LRUCache(maxsize=MEMORY_CACHE_SIZE)
+
         # Set default model path if not provided
         if model_path is None:
             # Try common locations
@@ -67,16 +150,34 @@ class HandEmbedder:
         if not os.path.exists(model_path):
             raise FileNotFoundError(f"Model file not found: {model_path}")
 
-        # Store model path for later use (we'll create landmarker per sequence)
         self.model_path = model_path
 
+        # Read the model and build the options once. A landmarker is still
+        # created per sequence: VIDEO mode tracks hands across calls, so
+        # sharing one would leak state from one clip into the next.
+        with open(model_path, "rb") as f:
+            model_buffer = f.read()
+        self._options = mp_vision.HandLandmarkerOptions(
+            base_options=mp_tasks.BaseOptions(model_asset_buffer=model_buffer),
+            running_mode=mp_vision.RunningMode.VIDEO,
+            num_hands=2,
+            min_hand_detection_confidence=0.5,
+            min_hand_presence_confidence=0.5,
+            min_tracking_confidence=0.5,
+        )
+
+        # Compile (or load from the on-disk cache) the smoothing kernel now,
+        # not on the first embedding request
+        self._ema_smooth(np.zeros((2, 126), dtype=np.float32), alpha=self.ema_alpha)
+
     # ----------------------------
     # Public API
     # ----------------------------
     def embed_gif(self, gif_path: str) -> np.ndarray:
         """Embed a GIF file. Returns (388,) float32 vector."""
-        frames, times, timestamps_ms = self._load_gif_with_time(gif_path)
-        return self._embed_from_frames(frames, times, timestamps_ms)
+        return self._cached(
+            gif_path, "gif", lambda: self._embed_from_frames(_prefetch(self._iter_gif_frames(gif_path)))
+        )
 
     def embed_video(self, video_path: str, flip: bool = False) -> np.ndarray:
         """
@@ -86,28 +187,71 @@ class HandEmbedder:
             video_path: Path to video file
             flip: If True, horizontally flip frames (for mirror robustness)
         """
-        frames, times, timestamps_ms = self._load_video_with_time(video_path, flip=flip)
-        return self._embed_from_frames(frames, times, timestamps_ms)
+        return self._cached(
+            video_path,
+            f"video flip={flip}",
+            lambda: self._embed_from_frames(_prefetch(self._iter_video_frames(video_path, flip=flip))),
+        )
 
     def close(self):
         """Release MediaPipe resources."""
         # HandLandmarker instances are created per sequence and cleaned up via context manager
         pass
 
+    # ----------------------------
+    # Embedding cache
+    # ----------------------------
+    def _cached(self, path: str, variant: str, compute) -> np.ndarray:
+        """
+        Return the embedding of `path` from the memory or disk cache, calling
+        `compute` and storing its result on a miss.
+
+        The key covers the file (absolute path, mtime, size), how it is read
+        (`variant`) and every setting that affects the output, so an edited
+        file or different parameters never hit a stale entry.
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return compute()  # let the loader report the missing file as before
+
+        params = (
+            self.target_frames, self.sample_fps, self.max_seconds, self.ema_alpha,
+            os.path.abspath(self.model_path), MAX_FRAME_WIDTH,
+        )
+        key = hashlib.sha1(
+            repr((os.path.abspath(path), st.st_mtime_ns, st.st_size, variant, params)).encode()
+        ).hexdigest()
+
+        emb = self._memory_cache.get(key)
+        if emb is not None:
+            return emb.copy()
+
+        npy_path = os.path.join(self.cache_dir, f"{key}.npy") if self.cache_dir else None
+        if npy_path and os.path.exists(npy_path):
+            emb = np.load(npy_path)
+        else:
+            emb = compute()
+            if npy_path:
+                # Write then rename, so concurrent indexers never read a partial file
+                tmp_path = f"{npy_path}.{os.getpid()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    np.save(f, emb)
+                os.replace(tmp_path, npy_path)
+
+        self._memory_cache[key] = emb
+        return emb.copy()
+
     # ----------------------------
     # Loading + time base
     # ----------------------------
-    def _load_gif_with_time(self, gif_path: str):
-        """Load GIF frames with timing information from frame durations.
+    def _iter_gif_frames(self, gif_path: str):
+        """Decode GIF frames with timing information from frame durations.
         
-        Returns:
-            frames: List of RGB numpy arrays
-            times: Array of times in seconds (for compatibility)
-            timestamps_ms: List of timestamps in milliseconds (for MediaPipe VIDEO mode)
+        Yields:
+            (frame, timestamp_ms): RGB numpy array and its start time in
+            milliseconds (for MediaPipe VIDEO mode)
         """
-        frames = []
-        times = []
-        timestamps_ms = []
         t_ms = 0.0
 
         with Image.open(gif_path) as im:
@@ -115,79 +259,79 @@ class HandEmbedder:
             while True:
                 try:
                     im.seek(i)
-                    frames.append(np.array(im.convert("RGB")))
-                    dur = float(im.info.get("duration", 100.0))  # ms
-                    dur = max(dur, 1.0)
-                    times.append(t_ms / 1000.0)
-                    timestamps_ms.append(int(t_ms))
-                    t_ms += dur
-                    i += 1
                 except EOFError:
                     break
-
-        return frames, np.array(times, dtype=np.float32), timestamps_ms
-
-    def _load_video_with_time(self, video_path: str, flip: bool = False):
-        """Load video frames with FPS-aware sampling.
+                frame = np.array(im.convert("RGB"))
+                dur = max(float(im.info.get("duration", 100.0)), 1.0)  # ms
+                yield frame, int(t_ms)
+                t_ms += dur
+                i += 1
+
+    def _iter_video_frames(self, video_path: str, flip: bool = False):
+        """Decode video frames with FPS-aware sampling.
         
-        Returns:
-            frames: List of RGB numpy arrays
-            times: Array of times in seconds (for compatibility)
-            timestamps_ms: List of timestamps in milliseconds (for MediaPipe VIDEO mode)
+        Yields:
+            (frame, timestamp_ms): RGB numpy array and its sample time in
+            milliseconds (for MediaPipe VIDEO mode)
         """
-        cap = cv2.VideoCapture(video_path)
+        # Use a hardware decoder when the FFmpeg backend has one; software otherwise
+        cap = cv2.VideoCapture(
+            video_path, cv2.CAP_ANY, [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+        )
         if not cap.isOpened():
-            return [], np.array([], dtype=np.float32), []
+            return
 
         src_fps = cap.get(cv2.CAP_PROP_FPS)
         if not src_fps or src_fps <= 1e-3:
             src_fps = 30.0  # reasonable fallback
 
-        frames = []
-        times = []
-        timestamps_ms = []
         max_frames = int(self.sample_fps * self.max_seconds)
         step = max(int(round(src_fps / self.sample_fps)), 1)
 
         frame_i = 0
         kept = 0
-        while kept < max_frames:
-            ret, frame = cap.read()
-            if not ret:
-                break
-            if frame_i % step == 0:
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                
-                # Horizontal flip for mirror robustness
-                if flip:
-                    frame = np.ascontiguousarray(frame[:, ::-1, :])
-                
-                frames.append(frame)
-                time_sec = kept / float(self.sample_fps)
-                times.append(time_sec)
-                timestamps_ms.append(int(time_sec * 1000))
-                kept += 1
-            frame_i += 1
-
-        cap.release()
-        return frames, np.array(times, dtype=np.float32), timestamps_ms
+        try:
+            while kept < max_frames:
+                # Only sampled frames are retrieve()d (converted to BGR and copied out)
+                if not cap.grab():
+                    break
+                if frame_i % step == 0:
+                    ret, frame = cap.retrieve()
+                    if not ret:
+                        break
+                    # The landmarker works at a much lower resolution internally,
+                    # so shrink HD/4K frames before converting and copying them
+                    h, w = frame.shape[:2]
+                    if w > MAX_FRAME_WIDTH:
+                        frame = cv2.resize(
+                            frame, (MAX_FRAME_WIDTH, int(MAX_FRAME_WIDTH * h / w)), interpolation=cv2.INTER_AREA
+                        )
+                    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame)
+                    
+                    # Horizontal flip for mirror robustness
+                    if flip:
+                        frame = cv2.flip(frame, 1)
+                    
+                    time_sec = kept / float(self.sample_fps)
+                    yield frame, int(time_sec * 1000)
+                    kept += 1
+                frame_i += 1
+        finally:
+            cap.release()
 
     # ----------------------------
     # Core pipeline
     # ----------------------------
-    def _embed_from_frames(self, frames, times: np.ndarray, timestamps_ms: list[int]) -> np.ndarray:
+    def _embed_from_frames(self, frames) -> np.ndarray:
         """Core embedding pipeline from frames.
         
         Args:
-            frames: List of RGB numpy arrays
-            times: Array of times in seconds (kept for compatibility)
-            timestamps_ms: List of timestamps in milliseconds for MediaPipe VIDEO mode
+            frames: Iterable of (RGB numpy array, timestamp_ms) pairs
         """
-        if not frames:
-            raise ValueError("No frames loaded")
-
         # 1) Landmarks + wrist xy (for optional location features)
-        X_raw, present, wrist_xy = self._extract_landmarks(frames, timestamps_ms)
+        X_raw, present, wrist_xy = self._extract_landmarks(frames)
+        if X_raw.shape[0] == 0:
+            raise ValueError("No frames loaded")
 
         # 2) Trim idle frames (reduces webcam lead-in/lead-out noise)
         X_raw, present, wrist_xy = self._trim_to_activity(X_raw, present, wrist_xy, pad=2)
@@ -214,54 +358,53 @@ class HandEmbedder:
     # ----------------------------
     # Landmark extraction with stable slot assignment
     # ----------------------------
-    def _extract_landmarks(self, frames, timestamps_ms: list[int]):
+    def _extract_landmarks(self, frames):
         """
         Extract landmarks with stable hand slot assignment using HandLandmarker API.
         
         Args:
-            frames: List of RGB numpy arrays
-            timestamps_ms: List of timestamps in milliseconds for VIDEO mode
+            frames: Iterable of (RGB numpy array, timestamp_ms) pairs, with
+                timestamps in milliseconds for VIDEO mode
         
         Returns:
             X: (L, 126) landmark array
             present: (L, 2) boolean array indicating hand presence
             wrist_xy: (L, 2, 2) wrist x,y positions (NaN when missing)
         """
-        L = len(frames)
-        X = np.zeros((L, 2, 21, 3), dtype=np.float32)
-        present = np.zeros((L, 2), dtype=bool)
-        wrist_xy = np.full((L, 2, 2), np.nan, dtype=np.float32)
+        # Per-frame rows; frames arrive one at a time, so L is only known at the end
+        X_rows = []
+        present_rows = []
+        wrist_rows = []
 
         prev_wrist = [None, None]  # per slot: np.array([x,y]) in image-normalised coords
 
-        # Create HandLandmarker instance for this sequence
-        BaseOptions = mp_tasks.BaseOptions
-        HandLandmarker = mp_vision.HandLandmarker
-        HandLandmarkerOptions = mp_vision.HandLandmarkerOptions
-        VisionRunningMode = mp_vision.RunningMode
-
-        options = HandLandmarkerOptions(
-            base_options=BaseOptions(model_asset_path=self.model_path),
-            running_mode=VisionRunningMode.VIDEO,
-            num_hands=2,
-            min_hand_detection_confidence=0.5,
-            min_hand_presence_confidence=0.5,
-            min_tracking_confidence=0.5,
-        )
-
-        with HandLandmarker.create_from_options(options) as landmarker:
-            for i, (frame, timestamp_ms) in enumerate(zip(frames, timestamps_ms)):
+        # Fresh HandLandmarker for this sequence, from the cached options
+        with mp_vision.HandLandmarker.create_from_options(self._options) as landmarker:
+            for frame, timestamp_ms in frames:
                 # Convert numpy array to MediaPipe Image with explicit dimensions
                 mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=frame)
                 
                 # Process frame in VIDEO mode with timestamp
                 result = landmarker.detect_for_video(mp_image, timestamp_ms)
+
+                X_i = np.zeros((2, 21, 3), dtype=np.float32)
+                present_i = np.zeros(2, dtype=bool)
+                wrist_i = np.full((2, 2), np.nan, dtype=np.float32)
+                X_rows.append(X_i)
+                present_rows.append(present_i)
+                wrist_rows.append(wrist_i)
                 
                 hands = []
 
                 if result.hand_landmarks:
                     for h_lm in result.hand_landmarks:
-                        coords = np.array([[lm.x, lm.y, lm.z] for lm in h_lm], dtype=np.float32)
+                        # Fill the float32 buffer straight from the landmark
+                        # objects, without building nested Python lists
+                        coords = np.fromiter(
+                            (v for lm in h_lm for v in (lm.x, lm.y, lm.z)),
+                            dtype=np.float32,
+                            count=63,
+                        ).reshape(21, 3)
                         wrist = coords[0, :2].copy()
                         hands.append((coords, wrist))
 
@@ -272,9 +415,9 @@ class HandEmbedder:
                 if len(hands) == 1:
                     coords, wrist = hands[0]
                     slot = self._best_slot_for_single(wrist, prev_wrist)
-                    X[i, slot] = coords
-                    present[i, slot] = True
-                    wrist_xy[i, slot] = wrist
+                    X_i[slot] = coords
+                    present_i[slot] = True
+                    wrist_i[slot] = wrist
                     prev_wrist[slot] = wrist
                 else:
                     (c0, w0), (c1, w1) = hands[0], hands[1]
@@ -295,17 +438,20 @@ class HandEmbedder:
                             a0, a1 = (c1, w1), (c0, w0)
 
                     (cA, wA), (cB, wB) = a0, a1
-                    X[i, 0] = cA
-                    present[i, 0] = True
-                    wrist_xy[i, 0] = wA
+                    X_i[0] = cA
+                    present_i[0] = True
+                    wrist_i[0] = wA
                     prev_wrist[0] = wA
                     
-                    X[i, 1] = cB
-                    present[i, 1] = True
-                    wrist_xy[i, 1] = wB
+                    X_i[1] = cB
+                    present_i[1] = True
+                    wrist_i[1] = wB
                     prev_wrist[1] = wB
 
-        return X.reshape(L, 126), present, wrist_xy
+        L = len(X_rows)
+        if L == 0:
+            return np.zeros((0, 126), dtype=np.float32), np.zeros((0, 2), dtype=bool), np.zeros((0, 2, 2), dtype=np.float32)
+        return np.stack(X_rows).reshape(L, 126), np.stack(present_rows), np.stack(wrist_rows)
 
     def _best_slot_for_single(self, wrist, prev_wrist):
         """Determine best slot for a single detected hand based on continuity."""
@@ -338,35 +484,33 @@ class HandEmbedder:
         """Interpolate missing landmarks between detected frames."""
         L = X_raw.shape[0]
         X = X_raw.reshape(L, 2, 21, 3).copy()
+        frames = np.arange(L)
 
         for h in range(2):
-            idx = np.where(present[:, h])[0]
+            idx = np.flatnonzero(present[:, h])
             if len(idx) == 0:
                 continue
 
-            first, last = idx[0], idx[-1]
-            # Forward fill from first detection
-            X[:first, h] = X[first, h]
-            # Backward fill from last detection
-            X[last + 1:, h] = X[last, h]
+            # Nearest detection at/before and at/after each frame. Clamping at
+            # the ends makes lo == hi before the first and after the last
+            # detection, as on detected frames, so copying X[lo] there
+            # forward/backward fills and leaves detections as they are.
+            lo = idx[np.maximum(np.searchsorted(idx, frames, side="right") - 1, 0)]
+            hi = idx[np.minimum(np.searchsorted(idx, frames), len(idx) - 1)]
+            X[:, h] = X[lo, h]
 
-            # Linear interpolation for gaps
-            for t in range(first, last):
-                if present[t, h]:
-                    continue
-                t2 = idx[idx > t][0]
-                t1 = idx[idx < t][-1]
-                a = (t - t1) / float(t2 - t1)
-                X[t, h] = (1 - a) * X[t1, h] + a * X[t2, h]
+            # Only frames inside a gap are blended
+            gap = hi > lo
+            lo, hi = lo[gap], hi[gap]
+            w = ((frames[gap] - lo) / (hi - lo))[:, None, None]
+            X[gap, h] = (1 - w).astype(X.dtype) * X[lo, h] + w.astype(X.dtype) * X[hi, h]
 
         return X.reshape(L, 126)
 
     def _ema_smooth(self, X, alpha=0.65):
         """Apply exponential moving average smoothing."""
-        Y = X.copy()
-        for t in range(1, Y.shape[0]):
-            Y[t] = alpha * Y[t] + (1 - alpha) * Y[t - 1]
-        return Y
+        # Weights in X's dtype, so float32 input is smoothed in float32 as before
+        return _ema_kernel(X, X.dtype.type(alpha), X.dtype.type(1 - alpha))
 
     # ----------------------------
     # Normalise + resample
@@ -374,25 +518,19 @@ class HandEmbedder:
     def _normalize_sequence(self, X_raw):
         """Normalize landmarks: wrist-centered, scaled by wrist->middle_mcp distance."""
         L = X_raw.shape[0]
-        X_reshaped = X_raw.reshape(L, 2, 21, 3)
-        X_norm = np.zeros_like(X_reshaped)
+        H = X_raw.reshape(L, 2, 21, 3)
 
         WRIST = 0
         MIDDLE_MCP = 9
 
-        for t in range(L):
-            for h in range(2):
-                hand = X_reshaped[t, h]
-                if np.all(hand == 0):
-                    continue
-                wrist = hand[WRIST]
-                middle = hand[MIDDLE_MCP]
-                hand_centered = hand - wrist
-                dist = np.linalg.norm(middle - wrist)
-                scale = dist if dist > 1e-6 else 1.0
-                X_norm[t, h] = hand_centered / scale
+        wrist = H[:, :, WRIST:WRIST + 1, :]                              # (L, 2, 1, 3)
+        scale = np.linalg.norm(H[:, :, MIDDLE_MCP, :] - wrist[:, :, 0, :], axis=-1)  # (L, 2)
+        # All-zero hands (never detected) stay zero
+        mask = H.reshape(L, 2, 63).any(axis=-1)
+        scale = np.where((scale > 1e-6) & mask, scale, 1.0)
 
-        return X_norm.reshape(L, 126)
+        X_norm = (H - wrist) / scale[..., None, None] * mask[..., None, None]
+        return X_norm.astype(X_raw.dtype, copy=False).reshape(L, 126)
 
     def _resample_sequence(self, X, target_len):
         """Resample sequence to fixed length using linear interpolation."""
@@ -402,25 +540,28 @@ class HandEmbedder:
         if L <= 1:
             return np.repeat(X[:1], target_len, axis=0) if L == 1 else np.zeros((target_len, D), np.float32)
 
-        x_old = np.linspace(0, 1, L)
-        x_new = np.linspace(0, 1, target_len)
-        X_new = np.zeros((target_len, D), dtype=np.float32)
-        for d in range(D):
-            X_new[:, d] = np.interp(x_new, x_old, X[:, d])
-        return X_new
+        # Fractional source index of each output frame, blended between its
+        # two neighbouring rows in one pass over all dims
+        pos = np.linspace(0, L - 1, target_len)
+        lo = np.floor(pos).astype(np.int64)
+        hi = np.minimum(lo + 1, L - 1)
+        w = (pos - lo).astype(np.float32)[:, None]
+        X = X.astype(np.float32, copy=False)
+        return X[lo] * (1 - w) + X[hi] * w
 
     # ----------------------------
     # Embedding
     # ----------------------------
     def _compute_temporal_stats(self, X):
         """Compute temporal statistics: mean, std, velocity_mean."""
-        mean_vec = X.mean(axis=0)
-        std_vec = X.std(axis=0)
-        if X.shape[0] > 1:
-            velocity_mean = np.diff(X, axis=0).mean(axis=0)
-        else:
-            velocity_mean = np.zeros(X.shape[1], dtype=np.float32)
-        return np.concatenate([mean_vec, std_vec, velocity_mean]).astype(np.float32)
+        L = X.shape[0]
+        # Sum and sum of squares in one pass (float64 to keep the variance stable)
+        mean_vec = X.sum(axis=0, dtype=np.float64) / L
+        sq_mean = np.einsum("ij,ij->j", X, X, dtype=np.float64) / L
+        std_vec = np.sqrt(np.maximum(sq_mean - mean_vec * mean_vec, 0.0))
+        # Mean of successive diffs telescopes to (last - first) / (L - 1)
+        velocity_mean = (X[-1] - X[0]) / max(L - 1, 1)
+        return np.concatenate((mean_vec, std_vec, velocity_mean)).astype(np.float32, copy=False)
 
     def _wrist_location_stats(self, wrist_xy):
         """
@@ -434,26 +575,23 @@ class HandEmbedder:
               - per slot: mean(x,y), std(x,y) => 8 dims
               - inter-wrist distance mean/std (when both available) => 2 dims
         """
-        feats = []
-        for h in range(2):
-            w = wrist_xy[:, h, :]  # (L, 2)
-            valid = ~np.isnan(w).any(axis=1)
-            if valid.any():
-                feats.extend(np.nanmean(w[valid], axis=0).tolist())
-                feats.extend(np.nanstd(w[valid], axis=0).tolist())
-            else:
-                feats.extend([0.0, 0.0, 0.0, 0.0])
+        valid = ~np.isnan(wrist_xy).any(axis=2)          # (L, 2) slot has a wrist
+        n = np.maximum(valid.sum(axis=0), 1)[:, None]     # (2, 1)
+
+        # Per-slot mean/std over the frames where that slot is present;
+        # missing frames are zeroed out of the sums, never-seen slots give 0
+        w = np.where(valid[..., None], wrist_xy, 0.0)
+        means = w.sum(axis=0) / n                         # (2, 2)
+        dev = np.where(valid[..., None], wrist_xy - means, 0.0)
+        stds = np.sqrt((dev ** 2).sum(axis=0) / n)        # (2, 2)
+        per_slot = np.concatenate([means, stds], axis=1).ravel()  # mean x,y, std x,y per slot
 
         # Inter-wrist distance when both hands visible
-        both = (~np.isnan(wrist_xy[:, 0, :]).any(axis=1)) & (~np.isnan(wrist_xy[:, 1, :]).any(axis=1))
-        if both.any():
-            d = np.linalg.norm(wrist_xy[both, 0, :] - wrist_xy[both, 1, :], axis=1)
-            feats.append(float(d.mean()))
-            feats.append(float(d.std()))
-        else:
-            feats.extend([0.0, 0.0])
+        both = valid.all(axis=1)
+        d = np.linalg.norm(wrist_xy[both, 0, :] - wrist_xy[both, 1, :], axis=1)
+        inter = [d.mean(), d.std()] if d.size else [0.0, 0.0]
 
-        return np.array(feats, dtype=np.float32)
+        return np.concatenate([per_slot, inter]).astype(np.float32)
 
     # ----------------------------
     # Utility: Hand coverage check
@@ -469,10 +607,9 @@ class HandEmbedder:
         Returns:
             True if coverage is sufficient, False otherwise
         """
-        frames, _, timestamps_ms = self._load_video_with_time(video_path)
-        if not frames:
+        _, present, _ = self._extract_landmarks(_prefetch(self._iter_video_frames(video_path)))
+        if present.shape[0] == 0:
             return False
         
-        _, present, _ = self._extract_landmarks(frames, timestamps_ms)
         coverage = present.any(axis=1).mean()
         return coverage >= threshold
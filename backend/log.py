@@ -0,0 +1,34 @@
+"""
+Logging for the backend.
+
+All backend loggers are children of "unmute". Records go through a queue and
+are formatted/written by a background listener thread, so request handlers
+never block on stderr. Configured on first import, before any module logs.
+
+Environment Variables:
+    LOG_LEVEL: Minimum level to emit (default: INFO). DEBUG shows per-request messages.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+
+logger = logging.getLogger("unmute")
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO").upper())
+logger.propagate = False
+
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_stream = logging.StreamHandler(sys.stderr)
+_log_stream.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream)
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+
+def get_logger(module_name: str) -> logging.Logger:
+    """Logger for a backend module, e.g. get_logger(__name__) -> "unmute.vocab"."""
+    return logger.getChild(module_name.rsplit(".", 1)[-1])
@@ -0,0 +1,13 @@
+"""
+Filesystem locations of the bundled datasets, resolved once at import.
+
+Used when serving or reading assets locally (USE_GCS=false). With GCS enabled
+the same layout is used as object prefixes inside the bucket.
+"""
+
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DATASET_PATH = PROJECT_ROOT / "sgsl_dataset"
+PROCESSED_PATH = PROJECT_ROOT / "sgsl_processed"
+LANDMARKS_PKL_PATH = PROCESSED_PATH / "landmarks_pkl"
@@ -0,0 +1,123 @@
+"""
+Semantic cache for text_to_gloss results.
+
+Exact-match caching misses paraphrases ("I am hungry" vs "I'm hungry"). This
+cache keeps L2-normalised prompt embeddings in a float32 matrix and returns the
+stored gloss of the closest previous prompt when the cosine similarity clears
+a threshold, so near-duplicate queries skip the Gemini generation call.
+
+Environment Variables:
+    USE_SEMANTIC_CACHE: Set to 'true' to enable the cache (default: false)
+    SEMANTIC_CACHE_PATH: Optional .npz file used to persist the cache across restarts
+    SEMANTIC_CACHE_THRESHOLD: Minimum cosine similarity for a hit (default: 0.92)
+    SEMANTIC_CACHE_SIZE: Maximum number of entries (default: 2048)
+"""
+
+import os
+import json
+import threading
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from backend.log import get_logger
+
+logger = get_logger(__name__)
+
+USE_SEMANTIC_CACHE = os.environ.get("USE_SEMANTIC_CACHE", "false").lower() == "true"
+SEMANTIC_CACHE_PATH = os.environ.get("SEMANTIC_CACHE_PATH")
+SEMANTIC_CACHE_THRESHOLD = float(os.environ.get("SEMANTIC_CACHE_THRESHOLD", "0.92"))
+SEMANTIC_CACHE_SIZE = int(os.environ.get("SEMANTIC_CACHE_SIZE", "2048"))
+
+
+class SemanticCache:
+    """
+    Fixed-size (FIFO) store of (embedding, language, gloss_result) entries.
+
+    Entries live in a ring buffer: once `maxsize` is reached the oldest entry
+    is overwritten. Lookups only match entries recorded for the same language
+    argument, since the same sentence in a different language is a different
+    translation request.
+    """
+
+    def __init__(self, maxsize: int = SEMANTIC_CACHE_SIZE, threshold: float = SEMANTIC_CACHE_THRESHOLD):
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self._embeddings: Optional[np.ndarray] = None  # (maxsize, D), allocated on first add
+        self._languages = np.empty(maxsize, dtype=object)
+        self._results: List[Optional[Dict[str, Any]]] = [None] * maxsize
+        self._size = 0
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _normalize(embedding) -> np.ndarray:
+        vec = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm > 0 else vec
+
+    def lookup(self, embedding, language: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return the cached result for the most similar prompt, or None."""
+        query = self._normalize(embedding)
+        with self._lock:
+            if self._size == 0 or self._embeddings.shape[1] != query.shape[0]:
+                return None
+            scores = self._embeddings[:self._size] @ query
+            scores[self._languages[:self._size] != language] = -1.0
+            best = int(np.argmax(scores))
+            if scores[best] >= self.threshold:
+                return self._results[best]
+        return None
+
+    def add(self, embedding, language: Optional[str], result: Dict[str, Any]):
+        """Store a result, evicting the oldest entry when full."""
+        vec = self._normalize(embedding)
+        with self._lock:
+            if self._embeddings is None or self._embeddings.shape[1] != vec.shape[0]:
+                # First entry (or embedding model changed): (re)allocate the matrix
+                self._embeddings = np.zeros((self.maxsize, vec.shape[0]), dtype=np.float32)
+                self._size = 0
+                self._next = 0
+            slot = self._next
+            self._embeddings[slot] = vec
+            self._languages[slot] = language
+            self._results[slot] = result
+            self._next = (slot + 1) % self.maxsize
+            self._size = min(self._size + 1, self.maxsize)
+
+    def _ordered_slots(self) -> List[int]:
+        """Slot indices from oldest to newest."""
+        start = (self._next - self._size) % self.maxsize
+        return [(start + i) % self.maxsize for i in range(self._size)]
+
+    def save(self, path: str):
+        """Persist entries (oldest first) to an .npz file."""
+        with self._lock:
+            if self._size == 0:
+                return
+            slots = self._ordered_slots()
+            embeddings = self._embeddings[slots]
+            languages = np.array([self._languages[i] or "" for i in slots])
+            results = np.array([json.dumps(self._results[i]) for i in slots])
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        np.savez(path, embeddings=embeddings, languages=languages, results=results)
+        logger.info("[SemanticCache] Saved %s entries to %s", len(slots), path)
+
+    def load(self, path: str):
+        """Load entries previously written by save(). Missing files are ignored."""
+        if not os.path.exists(path):
+            return
+        try:
+            with np.load(path) as data:
+                embeddings = data["embeddings"]
+                languages = data["languages"]
+                results = data["results"]
+        except Exception as e:
+            logger.warning("[SemanticCache] Failed to load %s: %s", path, e)
+            return
+        for vec, lang, result in zip(embeddings, languages, results):
+            self.add(vec, str(lang) or None, json.loads(str(result)))
+        logger.info("[SemanticCache] Loaded %s entries from %s", len(self), path)
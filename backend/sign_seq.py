@@ -3,6 +3,10 @@ import pickle
 import numpy as np
 
 from backend.gcs_storage import read_pickle, USE_GCS
+from backend.paths import LANDMARKS_PKL_PATH
+from backend.log import get_logger
+
+logger = get_logger(__name__)
 
 # GCS path prefix for pickle files
 GCS_PKL_PREFIX = "sgsl_processed/landmarks_pkl"
@@ -10,31 +14,27 @@ GCS_PKL_PREFIX = "sgsl_processed/landmarks_pkl"
 class SignSequenceManager:
     def __init__(self, pkl_dir: str = None):
         if pkl_dir is None:
-            # Get absolute path relative to this file's location
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            parent_dir = os.path.dirname(current_dir)
-            pkl_dir = os.path.join(parent_dir, "sgsl_processed", "landmarks_pkl")
+            pkl_dir = str(LANDMARKS_PKL_PATH)
         self.pkl_dir = pkl_dir
         self.use_gcs = USE_GCS
-        print(f"[SignSequenceManager] PKL directory: {self.pkl_dir}")
-        print(f"[SignSequenceManager] Using GCS: {self.use_gcs}")
+        logger.info("[SignSequenceManager] PKL directory: %s", self.pkl_dir)
+        logger.info("[SignSequenceManager] Using GCS: %s", self.use_gcs)
 
     def _load_pkl_data(self, sign_name: str):
         """Load pickle data from GCS or local filesystem."""
         if self.use_gcs:
             gcs_path = f"{GCS_PKL_PREFIX}/{sign_name}.pkl"
-            print(f"[SignSequenceManager] Loading from GCS: {gcs_path}")
+            logger.debug("[SignSequenceManager] Loading from GCS: %s", gcs_path)
             data = read_pickle(gcs_path)
             if data is None:
-                print(f"[SignSequenceManager] Sign data not found in GCS for {sign_name}")
+                logger.warning("[SignSequenceManager] Sign data not found in GCS for %s", sign_name)
             return data
         else:
             pkl_path = os.path.join(self.pkl_dir, f"{sign_name}.pkl")
-            print(f"PKL path: {pkl_path}")
-            print(f"PKL path exists: {os.path.exists(pkl_path)}")
+            logger.debug("PKL path: %s", pkl_path)
             if not os.path.exists(pkl_path):
-                print(f"Sign data not found for {sign_name}")
-                print(f"Checked path: {os.path.abspath(pkl_path)}")
+                logger.warning("Sign data not found for %s", sign_name)
+                logger.debug("Checked path: %s", os.path.abspath(pkl_path))
                 return None
             
             with open(pkl_path, 'rb') as f:
@@ -45,18 +45,17 @@ class SignSequenceManager:
         pose_filename = f"{sign_name}_full_body_pose.pkl"
         if self.use_gcs:
             gcs_path = f"{GCS_PKL_PREFIX}/{pose_filename}"
-            print(f"[SignSequenceManager] Loading full-body pose from GCS: {gcs_path}")
+            logger.debug("[SignSequenceManager] Loading full-body pose from GCS: %s", gcs_path)
             data = read_pickle(gcs_path)
             if data is None:
-                print(f"[SignSequenceManager] Full-body pose data not found in GCS for {sign_name}")
+                logger.warning("[SignSequenceManager] Full-body pose data not found in GCS for %s", sign_name)
             return data
         else:
             pkl_path = os.path.join(self.pkl_dir, pose_filename)
-            print(f"Full-body pose PKL path: {pkl_path}")
-            print(f"Full-body pose PKL path exists: {os.path.exists(pkl_path)}")
+            logger.debug("Full-body pose PKL path: %s", pkl_path)
             if not os.path.exists(pkl_path):
-                print(f"Full-body pose data not found for {sign_name}")
-                print(f"Checked path: {os.path.abspath(pkl_path)}")
+                logger.warning("Full-body pose data not found for %s", sign_name)
+                logger.debug("Checked path: %s", os.path.abspath(pkl_path))
                 return None
             
             with open(pkl_path, 'rb') as f:
@@ -91,7 +90,7 @@ class SignSequenceManager:
                 non_zero_frames.append(row)
         
         if len(non_zero_frames) == 0:
-            print(f"[get_sign_frames] {sign_name}: No non-zero frames found")
+            logger.debug("[get_sign_frames] %s: No non-zero frames found", sign_name)
             return None
         
         # Stack into array for normalization
@@ -103,7 +102,7 @@ class SignSequenceManager:
         if len(X_nonzero) > 0:
             x_min = X_nonzero.min()
             x_max = X_nonzero.max()
-            print(f"[get_sign_frames] {sign_name}: Data range [{x_min:.4f}, {x_max:.4f}]")
+            logger.debug("[get_sign_frames] %s: Data range [%.4f, %.4f]", sign_name, x_min, x_max)
             
             # Normalize: (x - min) / (max - min)
             X_normalized = np.zeros_like(X_filtered)
@@ -127,7 +126,7 @@ class SignSequenceManager:
                 "right": rh
             })
         
-        print(f"[get_sign_frames] {sign_name}: {len(frames_out)} non-zero frames out of {L} total")
+        logger.debug("[get_sign_frames] %s: %s non-zero frames out of %s total", sign_name, len(frames_out), L)
             
         return {
             "frames": frames_out,
@@ -154,7 +153,7 @@ class SignSequenceManager:
             
         X = data["X"]
         L, D = X.shape
-        print(f"Data shape: ({L}, {D})")
+        logger.debug("Data shape: (%s, %s)", L, D)
         
         # Check data format based on dimension
         if D == 99:
@@ -173,7 +172,7 @@ class SignSequenceManager:
         elif D == 126:
             # Hand-only data: 21 landmarks × 3 coordinates × 2 hands
             # Convert to a format with left and right hand landmarks
-            print(f"Converting hand data (126 elements) to pose format")
+            logger.debug("Converting hand data (126 elements) to pose format")
             
             # Filter out zero-padded frames first
             non_zero_frames = []
@@ -183,7 +182,7 @@ class SignSequenceManager:
                     non_zero_frames.append(row)
             
             if len(non_zero_frames) == 0:
-                print(f"[get_sign_pose_frames] {sign_name}: No non-zero frames found")
+                logger.debug("[get_sign_pose_frames] %s: No non-zero frames found", sign_name)
                 return None
             
             # Stack into array for normalization
@@ -194,7 +193,7 @@ class SignSequenceManager:
             if len(X_nonzero) > 0:
                 x_min = X_nonzero.min()
                 x_max = X_nonzero.max()
-                print(f"[get_sign_pose_frames] {sign_name}: Data range [{x_min:.4f}, {x_max:.4f}]")
+                logger.debug("[get_sign_pose_frames] %s: Data range [%.4f, %.4f]", sign_name, x_min, x_max)
                 
                 # Normalize: (x - min) / (max - min)
                 X_normalized = np.zeros_like(X_filtered)
@@ -218,7 +217,7 @@ class SignSequenceManager:
                     "right_hand": rh
                 })
             
-            print(f"[get_sign_pose_frames] {sign_name}: {len(frames_out)} non-zero frames out of {L} total")
+            logger.debug("[get_sign_pose_frames] %s: %s non-zero frames out of %s total", sign_name, len(frames_out), L)
             
             return {
                 "frames": frames_out,
@@ -227,7 +226,7 @@ class SignSequenceManager:
                 "format": "hands"  # Indicate this is hand data
             }
         else:
-            print(f"Unknown data format with {D} elements")
+            logger.warning("Unknown data format with %s elements", D)
             return None
 
     def get_sign_full_body_pose_frames(self, sign_name: str):
@@ -249,11 +248,11 @@ class SignSequenceManager:
             
         X = data["X"]
         L, D = X.shape
-        print(f"[get_sign_full_body_pose_frames] {sign_name}: Data shape ({L}, {D})")
+        logger.debug("[get_sign_full_body_pose_frames] %s: Data shape (%s, %s)", sign_name, L, D)
         
         # Full body pose data should be 33 landmarks × 3 coordinates = 99
         if D != 99:
-            print(f"[get_sign_full_body_pose_frames] {sign_name}: Expected 99 dimensions, got {D}")
+            logger.warning("[get_sign_full_body_pose_frames] %s: Expected 99 dimensions, got %s", sign_name, D)
             return None
         
         # Convert to frames with raw coordinates (no normalization)
@@ -267,10 +266,10 @@ class SignSequenceManager:
                 pose = np.round(row.reshape(33, 3), 4).tolist()
                 frames_out.append({"pose": pose})
         
-        print(f"[get_sign_full_body_pose_frames] {sign_name}: {len(frames_out)} non-zero frames out of {L} total")
+        logger.debug("[get_sign_full_body_pose_frames] %s: %s non-zero frames out of %s total", sign_name, len(frames_out), L)
         
         if len(frames_out) == 0:
-            print(f"[get_sign_full_body_pose_frames] {sign_name}: WARNING - No non-zero frames found!")
+            logger.warning("[get_sign_full_body_pose_frames] %s: WARNING - No non-zero frames found!", sign_name)
             return None
         
         return {
@@ -0,0 +1,67 @@
+"""
+StaticFiles with browser/CDN caching headers for the sign asset mounts.
+
+Starlette already sends ETag/Last-Modified and answers conditional requests
+with 304; this adds a Cache-Control max-age so repeat fetches of the same GIF
+or pickle within that window never reach the server at all.
+
+Small files are also kept in memory, so a hot asset is served from a dict
+lookup instead of a threadpool file read. Larger files and range requests
+still go through FileResponse.
+
+Environment Variables:
+    STATIC_MAX_AGE: Cache lifetime for static assets in seconds (default: 86400)
+    STATIC_MEMORY_MAX_FILE: Largest file kept in memory, in bytes (default: 262144)
+    STATIC_MEMORY_CACHE_BYTES: Total memory for cached files, in bytes (default: 67108864)
+"""
+
+import os
+import threading
+
+from cachetools import LRUCache
+from starlette.background import BackgroundTask
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+STATIC_MAX_AGE = int(os.environ.get("STATIC_MAX_AGE", "86400"))
+STATIC_MEMORY_MAX_FILE = int(os.environ.get("STATIC_MEMORY_MAX_FILE", str(256 * 1024)))
+STATIC_MEMORY_CACHE_BYTES = int(os.environ.get("STATIC_MEMORY_CACHE_BYTES", str(64 * 1024 * 1024)))
+
+
+class CachedStaticFiles(StaticFiles):
+    def __init__(self, *args, max_age: int = STATIC_MAX_AGE, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_control = f"public, max-age={max_age}"
+        # (path, mtime_ns, size) -> file bytes; a changed file gets a new key
+        self._bodies: LRUCache = LRUCache(maxsize=STATIC_MEMORY_CACHE_BYTES, getsizeof=len)
+        self._bodies_lock = threading.Lock()
+
+    def file_response(self, full_path, stat_result: os.stat_result, scope: Scope, status_code: int = 200) -> Response:
+        request_headers = Headers(scope=scope)
+        # Built for its headers (ETag, Last-Modified, type, length); the file isn't opened here
+        response = FileResponse(full_path, status_code=status_code, stat_result=stat_result)
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+
+        if stat_result.st_size <= STATIC_MEMORY_MAX_FILE and "range" not in request_headers:
+            key = (str(full_path), stat_result.st_mtime_ns, stat_result.st_size)
+            with self._bodies_lock:
+                body = self._bodies.get(key)
+            if body is not None:
+                response = Response(body, status_code=status_code, headers=response.headers)
+            else:
+                # Serve this one from disk and fill the cache after it is sent
+                response.background = BackgroundTask(self._remember, key)
+
+        response.headers["Cache-Control"] = self.cache_control
+        return response
+
+    def _remember(self, key: tuple):
+        path, _, size = key
+        with open(path, "rb") as f:
+            body = f.read()
+        if len(body) == size:
+            with self._bodies_lock:
+                self._bodies[key] = body
@@ -1,14 +1,17 @@
 import json
 import os
+from functools import lru_cache
 from typing import Dict, List, Optional, Set
 
 from backend.gcs_storage import read_json, USE_GCS
+from backend.paths import PROCESSED_PATH
+from backend.log import get_logger
+
+logger = get_logger(__name__)
 
 # Paths
 current_dir = os.path.dirname(os.path.abspath(__file__))
-# Assuming sgsl_processed is at the project root, one level up from backend
-PROJECT_ROOT = os.path.dirname(current_dir)
-VOCAB_PATH = os.path.join(PROJECT_ROOT, "sgsl_processed", "vocab.json")
+VOCAB_PATH = str(PROCESSED_PATH / "vocab.json")
 ALIASES_PATH = os.path.join(current_dir, "aliases.json")
 
 # GCS path for vocab
@@ -31,16 +34,19 @@ class VocabLoader:
         self.sign_to_token: Dict[str, str] = {}
         self.aliases: Dict[str, str] = {}
         self.allowed_tokens_list: List[str] = []
+        # Per-instance memo of _resolve_token, cleared whenever the vocab loads
+        self.resolve_token = lru_cache(maxsize=8192)(self._resolve_token)
         self._load_data()
 
     def _load_data(self):
+        self.resolve_token.cache_clear()
         # Load Vocab (from GCS or local)
         data = None
         if USE_GCS:
-            print(f"[Vocab] Loading from GCS: {GCS_VOCAB_PATH}")
+            logger.info("[Vocab] Loading from GCS: %s", GCS_VOCAB_PATH)
             data = read_json(GCS_VOCAB_PATH)
         elif os.path.exists(VOCAB_PATH):
-            print(f"[Vocab] Loading from local: {VOCAB_PATH}")
+            logger.info("[Vocab] Loading from local: %s", VOCAB_PATH)
             with open(VOCAB_PATH, 'r', encoding='utf-8') as f:
                 data = json.load(f)
         
@@ -55,9 +61,9 @@ class VocabLoader:
             # Build reverse map
             self.sign_to_token = {v: k for k, v in self.token_to_sign.items()}
             self.allowed_tokens_list = list(self.token_to_sign.keys())
-            print(f"[Vocab] Loaded {len(self.allowed_tokens_list)} tokens")
+            logger.info("[Vocab] Loaded %s tokens", len(self.allowed_tokens_list))
         else:
-            print(f"Warning: Vocab file not found at {VOCAB_PATH} or GCS")
+            logger.warning("Vocab file not found at %s or GCS", VOCAB_PATH)
 
         # Load Aliases
         if os.path.exists(ALIASES_PATH):
@@ -96,6 +102,16 @@ class VocabLoader:
         """
         return self.allowed_tokens_list
 
+    def _resolve_token(self, token: str) -> Optional[str]:
+        """
+        Canonical, alias-resolved form of a gloss token, or None if it is not
+        in the vocabulary. Equivalent to apply_aliases(canon(token)) followed
+        by validate_token(). Called through self.resolve_token, which memoizes
+        it since models repeat the same tokens.
+        """
+        canon_token = self.apply_aliases(self.canon(token))
+        return canon_token if self.validate_token(canon_token) else None
+
     def validate_token(self, token: str) -> bool:
         """Check if a token exists in the vocabulary."""
         token = self.apply_aliases(token)
@@ -0,0 +1,52 @@
+"""
+Count Gemini tokens in the gloss system instruction for different ways of
+joining the vocabulary list, to pick the cheapest VOCAB_SEPARATOR.
+
+Usage:
+    python scripts/count_prompt_tokens.py
+
+Requires GEMINI_API_KEY (count_tokens is free and does not generate).
+"""
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend import gemini_client
+from backend.gemini_client import GeminiClient, GEMINI_MODEL
+from backend.vocab import vocab
+
+SEPARATORS = {
+    "comma": ", ",
+    "comma (no space)": ",",
+    "newline": "\n",
+    "pipe": "|",
+    "space": " ",
+}
+
+
+def main():
+    client = GeminiClient()
+    if not client.client:
+        print("GEMINI_API_KEY not set; token counts need the API.")
+        sys.exit(1)
+
+    tokens = vocab.get_allowed_tokens()
+    print(f"Vocabulary: {len(tokens)} tokens\n")
+
+    counts = {}
+    for name, separator in SEPARATORS.items():
+        gemini_client.VOCAB_SEPARATOR = separator
+        # A copy, so the instruction memo (keyed on list identity) is rebuilt
+        instruction = client._gloss_system_instruction(list(tokens))
+        result = client.client.models.count_tokens(model=GEMINI_MODEL, contents=instruction)
+        counts[name] = result.total_tokens
+        print(f"{name:>18}: {result.total_tokens} tokens")
+
+    best = min(counts, key=counts.get)
+    print(f"\nCheapest: {best} ({SEPARATORS[best]!r})")
+
+
+if __name__ == "__main__":
+    main()
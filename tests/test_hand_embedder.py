@@ -0,0 +1,198 @@
+import warnings
+
+import numpy as np
+import pytest
+
+pytest.importorskip("mediapipe")
+
+from backend.hand_embedder import HandEmbedder
+
+
+def _interp_missing_loop(X_raw, present):
+    """Per-gap loop _interp_missing was vectorized from."""
+    L = X_raw.shape[0]
+    X = X_raw.reshape(L, 2, 21, 3).copy()
+
+    for h in range(2):
+        idx = np.where(present[:, h])[0]
+        if len(idx) == 0:
+            continue
+
+        first, last = idx[0], idx[-1]
+        X[:first, h] = X[first, h]
+        X[last + 1:, h] = X[last, h]
+
+        for t in range(first, last):
+            if present[t, h]:
+                continue
+            t2 = idx[idx > t][0]
+            t1 = idx[idx < t][-1]
+            a = (t - t1) / float(t2 - t1)
+            X[t, h] = (1 - a) * X[t1, h] + a * X[t2, h]
+
+    return X.reshape(L, 126)
+
+
+@pytest.mark.parametrize("L", [0, 1, 2, 5, 32, 120])
+@pytest.mark.parametrize("p", [0.0, 0.2, 0.6, 1.0])
+def test_interp_missing_matches_loop(L, p):
+    rng = np.random.default_rng(L * 10 + int(p * 10))
+    X = rng.standard_normal((L, 126)).astype(np.float32)
+    present = rng.random((L, 2)) < p
+    if L > 4 and 0 < p < 1:
+        # Leading and trailing misses exercise the forward/backward fill
+        present[:2, 0] = False
+        present[-2:, 0] = False
+        present[L // 2, 0] = True
+
+    embedder = HandEmbedder.__new__(HandEmbedder)
+    got = embedder._interp_missing(X, present)
+    assert got.dtype == X.dtype
+    assert np.array_equal(got, _interp_missing_loop(X, present))
+
+
+def _ema_smooth_loop(X, alpha=0.65):
+    """Per-row NumPy recurrence _ema_smooth was compiled from."""
+    Y = X.copy()
+    for t in range(1, Y.shape[0]):
+        Y[t] = alpha * Y[t] + (1 - alpha) * Y[t - 1]
+    return Y
+
+
+@pytest.mark.parametrize("L", [1, 2, 30, 300])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_ema_smooth_matches_loop(L, dtype):
+    rng = np.random.default_rng(L)
+    X = rng.standard_normal((L, 126)).astype(dtype)
+    # Frames with no detections are all zeros
+    X[::3] = 0
+    X[:, 63:] = 0
+
+    embedder = HandEmbedder.__new__(HandEmbedder)
+    got = embedder._ema_smooth(X)
+    assert got.dtype == X.dtype
+    assert np.array_equal(got, _ema_smooth_loop(X))
+
+
+def _resample_sequence_loop(X, target_len):
+    """Per-dimension np.interp loop _resample_sequence was vectorized from."""
+    L, D = X.shape
+    if L == target_len:
+        return X
+    if L <= 1:
+        return np.repeat(X[:1], target_len, axis=0) if L == 1 else np.zeros((target_len, D), np.float32)
+
+    x_old = np.linspace(0, 1, L)
+    x_new = np.linspace(0, 1, target_len)
+    X_new = np.zeros((target_len, D), dtype=np.float32)
+    for d in range(D):
+        X_new[:, d] = np.interp(x_new, x_old, X[:, d])
+    return X_new
+
+
+@pytest.mark.parametrize("L", [0, 1, 2, 7, 32, 33, 150])
+@pytest.mark.parametrize("target_len", [1, 32, 64])
+def test_resample_sequence_matches_loop(L, target_len):
+    rng = np.random.default_rng(L * 100 + target_len)
+    X = rng.standard_normal((L, 126)).astype(np.float32)
+
+    embedder = HandEmbedder.__new__(HandEmbedder)
+    got = embedder._resample_sequence(X, target_len)
+    want = _resample_sequence_loop(X, target_len)
+    assert got.shape == want.shape == (target_len, 126)
+    assert got.dtype == np.float32
+    np.testing.assert_allclose(got, want, rtol=1e-6, atol=1e-6)
+
+
+def _normalize_sequence_loop(X_raw):
+    """Per-frame loop _normalize_sequence was vectorized from."""
+    L = X_raw.shape[0]
+    X_reshaped = X_raw.reshape(L, 2, 21, 3)
+    X_norm = np.zeros_like(X_reshaped)
+
+    for t in range(L):
+        for h in range(2):
+            hand = X_reshaped[t, h]
+            if np.all(hand == 0):
+                continue
+            wrist = hand[0]
+            middle = hand[9]
+            dist = np.linalg.norm(middle - wrist)
+            scale = dist if dist > 1e-6 else 1.0
+            X_norm[t, h] = (hand - wrist) / scale
+
+    return X_norm.reshape(L, 126)
+
+
+@pytest.mark.parametrize("L", [0, 1, 5, 64])
+def test_normalize_sequence_matches_loop(L):
+    rng = np.random.default_rng(L)
+    X = rng.random((L, 126)).astype(np.float32)
+    H = X.reshape(L, 2, 21, 3)
+    if L > 1:
+        # Undetected hands are all zeros
+        H[0, 1] = 0
+        H[::2, 0] = 0
+        # Middle MCP on top of the wrist: scale falls back to 1
+        H[1, 0, 9] = H[1, 0, 0]
+        H[-1, 1, 9] = H[-1, 1, 0] + 1e-8
+
+    embedder = HandEmbedder.__new__(HandEmbedder)
+    got = embedder._normalize_sequence(X)
+    assert got.dtype == X.dtype
+    np.testing.assert_allclose(got, _normalize_sequence_loop(X), rtol=1e-6, atol=1e-7)
+    if L > 1:
+        assert not got.reshape(L, 2, 63)[::2, 0].any()
+
+
+def _wrist_location_stats_loop(wrist_xy):
+    """Per-slot loop _wrist_location_stats was vectorized from."""
+    feats = []
+    for h in range(2):
+        w = wrist_xy[:, h, :]
+        valid = ~np.isnan(w).any(axis=1)
+        if valid.any():
+            feats.extend(np.nanmean(w[valid], axis=0).tolist())
+            feats.extend(np.nanstd(w[valid], axis=0).tolist())
+        else:
+            feats.extend([0.0, 0.0, 0.0, 0.0])
+
+    both = (~np.isnan(wrist_xy[:, 0, :]).any(axis=1)) & (~np.isnan(wrist_xy[:, 1, :]).any(axis=1))
+    if both.any():
+        d = np.linalg.norm(wrist_xy[both, 0, :] - wrist_xy[both, 1, :], axis=1)
+        feats.append(float(d.mean()))
+        feats.append(float(d.std()))
+    else:
+        feats.extend([0.0, 0.0])
+
+    return np.array(feats, dtype=np.float32)
+
+
+@pytest.mark.parametrize("L", [1, 3, 30, 120])
+def test_wrist_location_stats_matches_loop(L):
+    rng = np.random.default_rng(L)
+    wrist_xy = rng.random((L, 2, 2)).astype(np.float32)
+    wrist_xy[rng.random((L, 2)) < 0.3] = np.nan
+    # Rows where only x or only y is missing are excluded too
+    wrist_xy[0, 0, 0] = np.nan
+    wrist_xy[-1, 0, 1] = np.nan
+
+    embedder = HandEmbedder.__new__(HandEmbedder)
+    got = embedder._wrist_location_stats(wrist_xy)
+    assert got.shape == (10,) and got.dtype == np.float32
+    np.testing.assert_allclose(got, _wrist_location_stats_loop(wrist_xy), rtol=1e-6, atol=1e-6)
+
+
+def test_wrist_location_stats_never_seen_slot():
+    rng = np.random.default_rng(0)
+    wrist_xy = rng.random((20, 2, 2)).astype(np.float32)
+    wrist_xy[:, 1] = np.nan
+    wrist_xy[3, 0, 1] = np.nan
+
+    embedder = HandEmbedder.__new__(HandEmbedder)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        got = embedder._wrist_location_stats(wrist_xy)
+    # Second slot and the inter-wrist distance have no frames to average
+    assert np.array_equal(got[4:], np.zeros(6, np.float32))
+    np.testing.assert_allclose(got, _wrist_location_stats_loop(wrist_xy), rtol=1e-6, atol=1e-6)
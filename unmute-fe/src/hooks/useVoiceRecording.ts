@@ -2,7 +2,7 @@ import { useState, useCallback, useRef } from "react"
 import type { TranslationResult } from "./useTranslation"
 
 const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || "http://127.0.0.1:8000"
-const TRANSCRIBE_API_URL = `${API_BASE_URL}/api/transcribe`
+const TRANSCRIBE_API_URL = `${API_BASE_URL}/api/transcribe/upload`
 
 interface UseVoiceRecordingOptions {
   onResult?: (result: TranslationResult) => void
@@ -20,34 +20,21 @@ export function useVoiceRecording(options: UseVoiceRecordingOptions = {}) {
   const audioChunksRef = useRef<Blob[]>([])
   const streamRef = useRef<MediaStream | null>(null)
 
-  const blobToBase64 = (blob: Blob): Promise<string> => {
-    return new Promise((resolve, reject) => {
-      const reader = new FileReader()
-      reader.onloadend = () => {
-        const base64 = (reader.result as string).split(",")[1]
-        resolve(base64)
-      }
-      reader.onerror = reject
-      reader.readAsDataURL(blob)
-    })
-  }
-
   const transcribeAudio = useCallback(async () => {
     try {
       setIsProcessing(true)
       setError(null)
 
       const audioBlob = new Blob(audioChunksRef.current, { type: "audio/webm" })
-      const base64Audio = await blobToBase64(audioBlob)
+
+      // Send the raw recording as multipart form data (no base64 overhead)
+      const form = new FormData()
+      form.append("audio", audioBlob, "recording.webm")
+      form.append("auto_translate", "true")
 
       const res = await fetch(TRANSCRIBE_API_URL, {
         method: "POST",
-        headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({
-          audio_data: base64Audio,
-          mime_type: "audio/webm",
-          auto_translate: true,
-        }),
+        body: form,
       })
 
       if (!res.ok) {